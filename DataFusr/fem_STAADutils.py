@@ -39,13 +39,15 @@ import math
 import subprocess
 import time
 from datetime import date
+from operator import itemgetter
 from pathlib import Path
 from typing import Union, List, Optional
 
 from rhdhv_fem.output_items import ForceOutputItem, DisplacementOutputItem, ElementForceOutputItem
 # References for functions and classes in the rhdhv_fem package
 from rhdhv_fem.fem_tools import fem_create_folder, fem_write_log, fem_read_file
-from rhdhv_fem.geometries import SurfaceGeometryModel, ProfileGeometryModel, ArbitraryPolygonProfile
+from rhdhv_fem.geometries import SurfaceGeometryModel, ProfileGeometryModel, ArbitraryPolygonProfile, Geometry, \
+    PredefinedProfile, IsotropicThickness, TShape, Pipe, CircleProfile, Rectangle
 from rhdhv_fem.shape_geometries import Polyline, Line
 
 # Module usef for retrieving results from STAAD API
@@ -703,6 +705,42 @@ def _fem_create_model_staad(project: 'Project', folder: Union[Path, str] = None)
 ###   4. Convert STAAD to FEM
 ### ===================================================================================================================
 
+# Section properties of a general profile in a user table, in the order as provided in the std-file
+_USER_DEFINED_SECTION_KEYS = (
+    'area', 'depth', 'web_thickness', 'width', 'flange_thickness', 'second_moment_area_z', 'second_moment_area_y',
+    'second_moment_area_x', 'section_modulus_z', 'section_modulus_y', 'shear_area_y', 'shear_area_z',
+    'plastic_section_modulus_z', 'plastic_section_modulus_y', 'warping_constant', 'depth_of_web')
+
+# Components of the joint loads in the std-file, with the global axis and whether the component is a moment
+_JOINT_LOAD_COMPONENTS = (
+    ('FX', 'X', False), ('FY', 'Y', False), ('FZ', 'Z', False), ('MX', 'X', True), ('MY', 'Y', True), ('MZ', 'Z', True))
+
+# Conversion of the member loads, (load type, direction) in the std-file to (load type, key of the load value, axis)
+# The axes 'GX', 'GY' and 'GZ' are the global axes, the axes 'x', 'y' and 'z' are the local axes of the beam
+_MEMBER_LOAD_DISPATCH = {
+    ('uniform_force', 'GX'): ('force', 'force', 'GX'),
+    ('uniform_force', 'GY'): ('force', 'force', 'GY'),
+    ('uniform_force', 'GZ'): ('force', 'force', 'GZ'),
+    ('uniform_force', 'X'): ('force', 'force', 'x'),
+    ('uniform_force', 'Y'): ('force', 'force', 'y'),
+    ('uniform_force', 'Z'): ('force', 'force', 'z'),
+    ('uniform_moment', 'GX'): ('moment', 'moment', 'GX'),
+    ('uniform_moment', 'GY'): ('moment', 'moment', 'GY'),
+    ('uniform_moment', 'GZ'): ('moment', 'moment', 'GZ'),
+    ('uniform_moment', 'X'): ('moment', 'moment', 'x'),
+    ('uniform_moment', 'Y'): ('moment', 'moment', 'y'),
+    ('uniform_moment', 'Z'): ('moment', 'moment', 'z')}
+
+# Conversion of the element loads, (load type, direction) in the std-file to (load type, key of the load value, axis)
+_ELEMENT_LOAD_DISPATCH = {
+    ('pressure_on_full_plate', 'GX'): ('force', 'force', 'GX'),
+    ('pressure_on_full_plate', 'GY'): ('force', 'force', 'GY'),
+    ('pressure_on_full_plate', 'GZ'): ('force', 'force', 'GZ'),
+    ('uniform_moment', 'GX'): ('force', 'moment', 'GX'),
+    ('uniform_moment', 'GY'): ('force', 'moment', 'GY'),
+    ('uniform_moment', 'GZ'): ('force', 'moment', 'GZ')}
+
+
 class RawStdFile:
     """
     This class contains a copy of the std-file (model file created by STAAD) in python.
@@ -1159,22 +1197,23 @@ class RawStdFile:
                         while std_data[i] != 'PROFILE_POINTS':
                             section_data += std_data[i]
                             i += 1
-                        area = section_data.split(' ')[0]
-                        depth = section_data.split(' ')[1]
-                        web_thickness = section_data.split(' ')[2]
-                        width = section_data.split(' ')[3]
-                        flange_thickness = section_data.split(' ')[4]
-                        second_moment_area_z = section_data.split(' ')[5]
-                        second_moment_area_y = section_data.split(' ')[6]
-                        second_moment_area_x = section_data.split(' ')[7]
-                        section_modulus_z = section_data.split(' ')[8]
-                        section_modulus_y = section_data.split(' ')[9]
-                        shear_area_y = section_data.split(' ')[10]
-                        shear_area_z = section_data.split(' ')[11]
-                        plastic_section_modulus_z = section_data.split(' ')[12]
-                        plastic_section_modulus_y = section_data.split(' ')[13]
-                        warping_constant = section_data.split(' ')[14]
-                        depth_of_web = section_data.split(' ')[15]
+                        section_values = section_data.split(' ')
+                        area = float(section_values[0])
+                        depth = float(section_values[1])
+                        web_thickness = float(section_values[2])
+                        width = float(section_values[3])
+                        flange_thickness = float(section_values[4])
+                        second_moment_area_z = float(section_values[5])
+                        second_moment_area_y = float(section_values[6])
+                        second_moment_area_x = float(section_values[7])
+                        section_modulus_z = float(section_values[8])
+                        section_modulus_y = float(section_values[9])
+                        shear_area_y = float(section_values[10])
+                        shear_area_z = float(section_values[11])
+                        plastic_section_modulus_z = float(section_values[12])
+                        plastic_section_modulus_y = float(section_values[13])
+                        warping_constant = float(section_values[14])
+                        depth_of_web = float(section_values[15])
                         i += 1
                         profile_points = std_data[i]
                         while std_data[i+1][0].isnumeric():
@@ -1224,9 +1263,9 @@ class RawStdFile:
                         type_section = "circular_hollow_section"
                         self.member_properties[count] = dict()
                         # dimension STA, END, THI
-                        STA = std_data[i].split("PRIS ROUND ")[1].split(" ")[1]
-                        END = std_data[i].split("PRIS ROUND ")[1].split(" ")[3]
-                        THI = std_data[i].split("PRIS ROUND ")[1].split(" ")[5]
+                        STA = float(std_data[i].split("PRIS ROUND ")[1].split(" ")[1])
+                        END = float(std_data[i].split("PRIS ROUND ")[1].split(" ")[3])
+                        THI = float(std_data[i].split("PRIS ROUND ")[1].split(" ")[5])
 
                         self.member_properties[count] = {
                             'type_section': type_section,
@@ -1258,10 +1297,10 @@ class RawStdFile:
                         count += 1
                         self.member_properties[count] = dict()
                         # dimension YD, ZD
-                        YD = std_data[i].split("PRIS ")[1].split(" ")[1]
-                        ZD = std_data[i].split("PRIS ")[1].split(" ")[3]
-                        YB = std_data[i].split("PRIS ")[1].split(" ")[5]
-                        ZB = std_data[i].split("PRIS ")[1].split(" ")[7]
+                        YD = float(std_data[i].split("PRIS ")[1].split(" ")[1])
+                        ZD = float(std_data[i].split("PRIS ")[1].split(" ")[3])
+                        YB = float(std_data[i].split("PRIS ")[1].split(" ")[5])
+                        ZB = float(std_data[i].split("PRIS ")[1].split(" ")[7])
 
                         self.member_properties[count] = {
                             'type_section': type_section,
@@ -1281,9 +1320,9 @@ class RawStdFile:
                         count += 1
                         self.member_properties[count] = dict()
                         # dimension YD, ZD
-                        YD = std_data[i].split("PRIS ")[1].split(" ")[1]
-                        ZD = std_data[i].split("PRIS ")[1].split(" ")[3]
-                        ZB = std_data[i].split("PRIS ")[1].split(" ")[5]
+                        YD = float(std_data[i].split("PRIS ")[1].split(" ")[1])
+                        ZD = float(std_data[i].split("PRIS ")[1].split(" ")[3])
+                        ZB = float(std_data[i].split("PRIS ")[1].split(" ")[5])
 
                         self.member_properties[count] = {
                             'type_section': type_section,
@@ -1301,8 +1340,8 @@ class RawStdFile:
                         count += 1
                         self.member_properties[count] = dict()
                         # dimension YD, ZD
-                        YD = std_data[i].split("PRIS ")[1].split(" ")[1]
-                        ZD = std_data[i].split("PRIS ")[1].split(" ")[3]
+                        YD = float(std_data[i].split("PRIS ")[1].split(" ")[1])
+                        ZD = float(std_data[i].split("PRIS ")[1].split(" ")[3])
 
                         self.member_properties[count] = {
                             'type_section': type_section,
@@ -1319,7 +1358,7 @@ class RawStdFile:
                         count += 1
                         self.member_properties[count] = dict()
                         # dimension YD, ZD
-                        YD = std_data[i].split("PRIS ")[1].split(" ")[1]
+                        YD = float(std_data[i].split("PRIS ")[1].split(" ")[1])
 
                         self.member_properties[count] = {
                             'type_section': type_section,
@@ -1334,13 +1373,13 @@ class RawStdFile:
                         count += 1
                         self.member_properties[count] = dict()
                         # dimension F1,F2, .., F7
-                        F1 = std_data[i].split("TAPERED ")[1].split(" ")[0]
-                        F2 = std_data[i].split("TAPERED ")[1].split(" ")[1]
-                        F3 = std_data[i].split("TAPERED ")[1].split(" ")[2]
-                        F4 = std_data[i].split("TAPERED ")[1].split(" ")[3]
-                        F5 = std_data[i].split("TAPERED ")[1].split(" ")[4]
-                        F6 = std_data[i].split("TAPERED ")[1].split(" ")[5]
-                        F7 = std_data[i].split("TAPERED ")[1].split(" ")[6]
+                        F1 = float(std_data[i].split("TAPERED ")[1].split(" ")[0])
+                        F2 = float(std_data[i].split("TAPERED ")[1].split(" ")[1])
+                        F3 = float(std_data[i].split("TAPERED ")[1].split(" ")[2])
+                        F4 = float(std_data[i].split("TAPERED ")[1].split(" ")[3])
+                        F5 = float(std_data[i].split("TAPERED ")[1].split(" ")[4])
+                        F6 = float(std_data[i].split("TAPERED ")[1].split(" ")[5])
+                        F7 = float(std_data[i].split("TAPERED ")[1].split(" ")[6])
 
                         self.member_properties[count] = {
                             'type_section': type_section,
@@ -1362,8 +1401,8 @@ class RawStdFile:
                         count += 1
                         self.member_properties[count] = dict()
                         # dimension OD, ID
-                        od = re.findall('(OD\s+)([+-]?([0-9]*[.])?[0-9]+)', std_data[i])[0][1]
-                        id = re.findall('(ID\s+)([+-]?([0-9]*[.])?[0-9]+)', std_data[i])[0][1]
+                        od = float(re.findall('(OD\s+)([+-]?([0-9]*[.])?[0-9]+)', std_data[i])[0][1])
+                        id = float(re.findall('(ID\s+)([+-]?([0-9]*[.])?[0-9]+)', std_data[i])[0][1])
                         self.member_properties[count] = {
                             'type_section': type_section,
                             'OD': od,
@@ -2155,9 +2194,9 @@ class RawStdFile:
                         i += 1
                         # get loadcase_id and load factors
                         dict_factors = dict()
-                        for j in range((len(std_data[i].split(' ')) - 1)):
-                            if (j % 2) == 0:
-                                dict_factors[std_data[i].split(' ')[j]] = float(std_data[i].split(' ')[j + 1])
+                        factor_values = std_data[i].split(' ')
+                        for j in range(0, len(factor_values) - 1, 2):
+                            dict_factors[int(factor_values[j])] = float(factor_values[j + 1])
                         self.primary_loadcases[load_id]['load_items']['REPEAT LOAD'] = {'factors': dict_factors}
                         i += 1
 
@@ -2232,9 +2271,9 @@ class RawStdFile:
                 i += 1
                 # get loadcase_id and load factors
                 dict_factors = dict()
-                for j in range((len(std_data[i].split(' ')) - 1)):
-                    if (j % 2) == 0:
-                        dict_factors[std_data[i].split(' ')[j]] = float(std_data[i].split(' ')[j + 1])
+                factor_values = std_data[i].split(' ')
+                for j in range(0, len(factor_values) - 1, 2):
+                    dict_factors[int(factor_values[j])] = float(factor_values[j + 1])
 
                 self.load_combinations[loadcomb_id] = {
                     'loadcomb_name': loadcomb_name,
@@ -2322,16 +2361,14 @@ def convert_direction(RawStd: RawStdFile):
                 elif key1 == 'JOINT LOAD':
                     for key2, value2 in value1.items():
                         fx = value2['FX']
-                        if value2['FZ'] is None:
-                            fy = None
-                        else:
-                            fy = -1 * value2['FZ']
+                        fy = value2['FZ']
+                        if fy is not None:
+                            fy = -1 * fy
                         fz = value2['FY']
                         mx = value2['MX']
-                        if value2['MZ'] is None:
-                            my = None
-                        else:
-                            my = -1 * value2['MZ']
+                        my = value2['MZ']
+                        if my is not None:
+                            my = -1 * my
                         mz = value2['MY']
                         value2 = {
                             'FX': fx,
@@ -2396,6 +2433,85 @@ def check_required_information(raw_data: RawStdFile):
         print('WARNING: No load combination has definded in the model')
 
 
+def _make_connecting_items(node_id: str, node_to_beam_endpoint: dict, node_to_plate_line: dict, dict_beam: dict,
+                           staad_data: RawStdFile):
+    """
+    This function finds the beam or plate to which a node of a support or joint load is connected.
+
+    Input:
+        - node_id (str): ID of the node in the std-file.
+        - node_to_beam_endpoint (dict): Dictionary with the node ID as key and a tuple with the ID of a connected beam
+          and the end of the beam ('start' or 'end') as value.
+        - node_to_plate_line (dict): Dictionary with the coordinates of the corners of the plates (as tuple) as key and
+          a tuple with the surface shape and the node of its contour as value.
+        - dict_beam (dict): Dictionary with the beam ID as key and the line shape as value.
+        - staad_data (obj): Object reference of raw data from std-file.
+
+    Output:
+        - Returns the list with the connecting shape and the shape geometry of the node. None is returned if the node
+          is not connected to a beam or plate.
+    """
+    if node_id in node_to_beam_endpoint:
+        beam_id, endpoint = node_to_beam_endpoint[node_id]
+        if endpoint == 'start':
+            return [{
+                'connecting_shape': dict_beam[beam_id],
+                'shape_geometry': dict_beam[beam_id].contour.node_start}]
+        return [{
+            'connecting_shape': dict_beam[beam_id],
+            'shape_geometry': dict_beam[beam_id].contour.node_end}]
+
+    plate_node = node_to_plate_line.get(tuple(staad_data.joint_coordinates[node_id]))
+    if plate_node is not None:
+        return [{
+            'connecting_shape': plate_node[0],
+            'shape_geometry': plate_node[1]}]
+    return None
+
+
+def _resolve_load_factors(project: 'Project', factors: dict, loadcases: dict, repeat_only_factors: dict, name: str,
+                          _resolving: tuple = ()) -> dict:
+    """
+    This function converts the load factors of a REPEAT LOAD or load combination in the std-file to factors on the load
+    cases in the project. Load cases with only a repeat load are not created in the project, a factor on such a load
+    case is resolved into the factors of its repeat load.
+
+    Input:
+        - project (obj): Project object containing collections of fem objects an project variables.
+        - factors (dict): Dictionary with the load case ID in the std-file as key and the factor as value.
+        - loadcases (dict): Dictionary with the load case ID as key and the load case object in the project as value.
+        - repeat_only_factors (dict): Dictionary with the ID of each load case with only a repeat load as key and the
+          factors of that repeat load as value.
+        - name (str): Name of the repeat load or load combination, used in the logging.
+
+    Output:
+        - Returns the dictionary with the load case object as key and the factor as value. Factors on a load case that
+          can't be found or that is reached again through a circular repeat load are logged as warning and not
+          included.
+    """
+    group = {}
+    for key_factors, value_factors in factors.items():
+        if key_factors in loadcases:
+            loadcase = loadcases[key_factors]
+            group[loadcase] = group.get(loadcase, 0) + value_factors
+        elif key_factors in _resolving:
+            project.write_log(
+                f"WARNING: Load case {key_factors} in '{name}' has a circular REPEAT LOAD reference "
+                f"({' -> '.join(str(key) for key in _resolving + (key_factors,))}), the factor {value_factors} is not "
+                f"included.")
+        elif key_factors in repeat_only_factors:
+            resolved = _resolve_load_factors(
+                project, repeat_only_factors[key_factors], loadcases, repeat_only_factors, name,
+                _resolving + (key_factors,))
+            for loadcase, factor in resolved.items():
+                group[loadcase] = group.get(loadcase, 0) + value_factors * factor
+        else:
+            project.write_log(
+                f"WARNING: Load case {key_factors} in '{name}' could not be found in the project, the factor "
+                f"{value_factors} is not included.")
+    return group
+
+
 def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
     """
     This function reads the std-file that STAAD has generated of the model. Currently the function reads the following
@@ -2418,6 +2534,8 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
     Output:
         - The inputfile is read and converted to objects in FEM-client.
         - The objects are added to the class instance.
+        - Returns the mesh nodes created for the joints and the line shapes created for the members of the model, as
+          dictionaries {node_id: mesh_node} and {member_id: shape}.
 
     For example:
      >>> project.from_staad('C//Users//AnyFolder//inputfile.std')
@@ -2431,11 +2549,10 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
     check_required_information(RawStdFile(std_file))
     staad_data = convert_direction(RawStdFile(std_file))
 
+    # These modules refer back to the project and are therefore imported on call to prevent circular imports
     from rhdhv_fem.fem_mesh import MeshNode, MeshElement
     from rhdhv_fem.shapes import Surfaces, Lines
     from rhdhv_fem.materials import LinearElasticIsotropicModel, Concrete, Steel, CustomMaterial
-    from rhdhv_fem.geometries import Geometry, PredefinedProfile, IsotropicThickness, ArbitraryPolygonProfile, TShape, \
-        Pipe, CircleProfile, Rectangle
     from rhdhv_fem.supports import PointSupport
     from rhdhv_fem.loads import LoadCase, ModelLoad, LineLoad, SurfaceLoad, PointLoad, LoadCombination
     from rhdhv_fem.general import Direction
@@ -2446,34 +2563,36 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
 
     ## MATERIALS ##
     dict_material = dict()
-    for material in staad_data.materials:
+    for material, material_data in staad_data.materials.items():
+        # Collect the values describing the material once, to check the type of material
+        material_values = tuple(material_data.values())
         # Create the material-model
         material_model = None
-        if 'isotropic' in staad_data.materials[material].values():
-            material_model = LinearElasticIsotropicModel.from_staad(staad_data.materials[material], project=project)
+        if 'isotropic' in material_values:
+            material_model = LinearElasticIsotropicModel.from_staad(material_data, project=project)
         if not material_model:
             raise NotImplementedError(f'ERROR: Material model for {material} is not yet available.')
         else:
             # Create the material
-            if 'CONCRETE' in staad_data.materials[material].values():
+            if 'CONCRETE' in material_values:
                 material_dummy = Concrete.from_staad({
-                    'name': staad_data.materials[material]['name'],
+                    'name': material_data['name'],
                     'material_model': material_model,
-                    'mass_density': staad_data.materials[material]['mass_density'],
-                    'alpha': staad_data.materials[material]['alpha']}, project=project)
-            elif 'STEEL' in staad_data.materials[material].values():
+                    'mass_density': material_data['mass_density'],
+                    'alpha': material_data['alpha']}, project=project)
+            elif 'STEEL' in material_values:
                 material_dummy = Steel.from_staad({
-                    'name': staad_data.materials[material]['name'],
+                    'name': material_data['name'],
                     'material_model': material_model,
-                    'mass_density': staad_data.materials[material]['mass_density'],
-                    'alpha': staad_data.materials[material]['alpha']}, project=project)
+                    'mass_density': material_data['mass_density'],
+                    'alpha': material_data['alpha']}, project=project)
             else:
                 material_dummy = CustomMaterial.from_staad({
-                    'name': staad_data.materials[material]['name'],
+                    'name': material_data['name'],
                     'material_model': material_model,
-                    'mass_density': staad_data.materials[material]['mass_density'],
-                    'alpha': staad_data.materials[material]['alpha'],
-                    'damping_coefficient': staad_data.materials[material]['damping_coefficient']},
+                    'mass_density': material_data['mass_density'],
+                    'alpha': material_data['alpha'],
+                    'damping_coefficient': material_data['damping_coefficient']},
                     project=project)
             dict_material[material] = material_dummy
     for material_name in staad_data.constants:
@@ -2517,34 +2636,34 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
         if staad_data.member_properties[geometry]['type_section'] == 'rectangular':
             geometry_model = Rectangle.from_staad({
                 'profile_name': staad_data.member_properties[geometry]['type_section'],
-                'height': float(staad_data.member_properties[geometry]['YD']),
-                'width': float(staad_data.member_properties[geometry]['ZD'])}, project=project)
+                'height': staad_data.member_properties[geometry]['YD'],
+                'width': staad_data.member_properties[geometry]['ZD']}, project=project)
         elif staad_data.member_properties[geometry]['type_section'] == 'prismatic_tee':
             geometry_model = TShape.from_staad({
                 'profile_name': staad_data.member_properties[geometry]['type_section'],
-                'height': float(staad_data.member_properties[geometry]['YD']),
+                'height': staad_data.member_properties[geometry]['YD'],
                 'thickness_flange_top':
-                    float(staad_data.member_properties[geometry]['YD']) -
-                    float(staad_data.member_properties[geometry]['YB']),
-                'width_flange_top': float(staad_data.member_properties[geometry]['ZD']),
-                'thickness_web': float(staad_data.member_properties[geometry]['ZB'])}, project=project)
+                    staad_data.member_properties[geometry]['YD'] -
+                    staad_data.member_properties[geometry]['YB'],
+                'width_flange_top': staad_data.member_properties[geometry]['ZD'],
+                'thickness_web': staad_data.member_properties[geometry]['ZB']}, project=project)
         elif staad_data.member_properties[geometry]['type_section'] == 'prismatic_trapzoid':
             geometry_model = TShape.from_staad({
                 'profile_name': staad_data.member_properties[geometry]['type_section'],
-                'height': float(staad_data.member_properties[geometry]['YD']),
-                'thickness_flange_top': float(staad_data.member_properties[geometry]['YD']),
-                'width_flange_top': float(staad_data.member_properties[geometry]['ZD']),
-                'thickness_web': float(staad_data.member_properties[geometry]['ZB'])}, project=project)
+                'height': staad_data.member_properties[geometry]['YD'],
+                'thickness_flange_top': staad_data.member_properties[geometry]['YD'],
+                'width_flange_top': staad_data.member_properties[geometry]['ZD'],
+                'thickness_web': staad_data.member_properties[geometry]['ZB']}, project=project)
         elif staad_data.member_properties[geometry]['type_section'] == 'circular_hollow_section':
             geometry_model = Pipe.from_staad({
                 'profile_name': staad_data.member_properties[geometry]['type_section'],
-                'diameter': float(staad_data.member_properties[geometry]['start_diameter']),
-                'thickness': float(staad_data.member_properties[geometry]['thickness'])}, project=project)
+                'diameter': staad_data.member_properties[geometry]['start_diameter'],
+                'thickness': staad_data.member_properties[geometry]['thickness']}, project=project)
         elif staad_data.member_properties[geometry]['type_section'] == 'pipe':
             geometry_model = Pipe.from_staad({
                 'profile_name': staad_data.member_properties[geometry]['type_section'],
-                'diameter': float(staad_data.member_properties[geometry]['OD']),
-                'thickness': (float(staad_data.member_properties[geometry]['OD']) - float(staad_data.member_properties[geometry]['ID'])) / 2
+                'diameter': staad_data.member_properties[geometry]['OD'],
+                'thickness': (staad_data.member_properties[geometry]['OD'] - staad_data.member_properties[geometry]['ID']) / 2
             }, project=project)
         elif staad_data.member_properties[geometry]['type_section'] == 'predefined':
             geometry_model = PredefinedProfile.from_staad(
@@ -2552,28 +2671,12 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
         elif staad_data.member_properties[geometry]['type_section'] == 'circle':
             geometry_model = CircleProfile.from_staad({
                 'profile_name': staad_data.member_properties[geometry]['type_section'],
-                'diameter': float(staad_data.member_properties[geometry]['diameter'])
+                'diameter': staad_data.member_properties[geometry]['diameter']
             }, project=project)
         elif staad_data.member_properties[geometry]['type_section'] == 'user_defined':
-            input_dict = dict()
+            input_dict = {key: staad_data.member_properties[geometry][key] for key in _USER_DEFINED_SECTION_KEYS}
             input_dict['profile_name'] = staad_data.member_properties[geometry]['profile_name']
             input_dict['profile'] = staad_data.member_properties[geometry]['profile']
-            input_dict['area'] = float(staad_data.member_properties[geometry]['area'])
-            input_dict['depth'] = float(staad_data.member_properties[geometry]['depth'])
-            input_dict['web_thickness'] = float(staad_data.member_properties[geometry]['web_thickness'])
-            input_dict['width'] = float(staad_data.member_properties[geometry]['width'])
-            input_dict['flange_thickness'] = float(staad_data.member_properties[geometry]['flange_thickness'])
-            input_dict['second_moment_area_z'] = float(staad_data.member_properties[geometry]['second_moment_area_z'])
-            input_dict['second_moment_area_y'] = float(staad_data.member_properties[geometry]['second_moment_area_y'])
-            input_dict['second_moment_area_x'] = float(staad_data.member_properties[geometry]['second_moment_area_x'])
-            input_dict['section_modulus_z'] = float(staad_data.member_properties[geometry]['section_modulus_z'])
-            input_dict['section_modulus_y'] = float(staad_data.member_properties[geometry]['section_modulus_y'])
-            input_dict['shear_area_y'] = float(staad_data.member_properties[geometry]['shear_area_y'])
-            input_dict['shear_area_z'] = float(staad_data.member_properties[geometry]['shear_area_z'])
-            input_dict['plastic_section_modulus_z'] = float(staad_data.member_properties[geometry]['plastic_section_modulus_z'])
-            input_dict['plastic_section_modulus_y'] = float(staad_data.member_properties[geometry]['plastic_section_modulus_y'])
-            input_dict['warping_constant'] = float(staad_data.member_properties[geometry]['warping_constant'])
-            input_dict['depth_of_web'] = float(staad_data.member_properties[geometry]['depth_of_web'])
             geometry_model = ArbitraryPolygonProfile.from_staad(input_dict=input_dict, project=project)
         # Create geometry
         if not geometry_model:
@@ -2627,22 +2730,29 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
         connecting_node_2_member[staad_data.member_incidences[member_id]['start_node_ID']] = dict_beam[member_id]
         connecting_node_2_member[staad_data.member_incidences[member_id]['end_node_ID']] = dict_beam[member_id]
         connecting_line_2_member[member_id] = dict_beam[member_id].contour
+    # Split the plates in triangular and quadrilateral plates
+    tri_shells = dict()
+    quad_shells = dict()
+    for plate_id, plate_nodes in staad_data.element_incidences_shell.items():
+        if plate_nodes['node_4']:
+            quad_shells[plate_id] = plate_nodes
+        else:
+            tri_shells[plate_id] = plate_nodes
     # Create mesh-elements for plates
+    for plate_id, plate_nodes in tri_shells.items():
+        dict_meshplate[plate_id] = MeshElement.from_staad(
+            {'node_list': [dict_meshnode[plate_nodes['node_1']],
+                           dict_meshnode[plate_nodes['node_2']],
+                           dict_meshnode[plate_nodes['node_3']]],
+             'id': int(plate_id)}, project)
+    for plate_id, plate_nodes in quad_shells.items():
+        dict_meshplate[plate_id] = MeshElement.from_staad(
+            {'node_list': [dict_meshnode[plate_nodes['node_1']],
+                           dict_meshnode[plate_nodes['node_2']],
+                           dict_meshnode[plate_nodes['node_3']],
+                           dict_meshnode[plate_nodes['node_4']]],
+             'id': int(plate_id)}, project)
     for plate_id in staad_data.element_incidences_shell:
-        # Create the mesh elements
-        if not staad_data.element_incidences_shell[plate_id]['node_4']:
-            dict_meshplate[plate_id] = MeshElement.from_staad(
-                {'node_list': [dict_meshnode[staad_data.element_incidences_shell[plate_id]['node_1']],
-                               dict_meshnode[staad_data.element_incidences_shell[plate_id]['node_2']],
-                               dict_meshnode[staad_data.element_incidences_shell[plate_id]['node_3']]],
-                 'id': int(plate_id)}, project)
-        else:
-            dict_meshplate[plate_id] = MeshElement.from_staad(
-                {'node_list': [dict_meshnode[staad_data.element_incidences_shell[plate_id]['node_1']],
-                               dict_meshnode[staad_data.element_incidences_shell[plate_id]['node_2']],
-                               dict_meshnode[staad_data.element_incidences_shell[plate_id]['node_3']],
-                               dict_meshnode[staad_data.element_incidences_shell[plate_id]['node_4']]],
-                 'id': int(plate_id)}, project)
         # Create the surface shapes
         input_dict = dict()
         input_dict['polyline_plate'] = dict_meshplate[plate_id]
@@ -2662,10 +2772,10 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
         list_of_nodes = staad_data.groups['node_groups'][key]
         node_list = []
         for node in list_of_nodes:
-            mesh_node = (dict_meshnode[f'{node}'])
+            mesh_node = dict_meshnode[node]
             node_list.append(mesh_node)
-        group_dict[f'{name}'] = {'name': name,
-                                 'shapes': node_list}
+        group_dict[name] = {'name': name,
+                         'shapes': node_list}
         group = Group.from_staad(input_dict={'name': name,
                                              'nodes': node_list},
                                  project=project)
@@ -2674,33 +2784,30 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
         list_of_shapes = staad_data.groups['shape_groups'][key]
         shape_list = []
         for shape_id in list_of_shapes:
-            if shape_id in dict_beam.keys():
-                shape_list.append(dict_beam[f'{shape_id}'])
-                continue
-            elif shape_id in dict_plate.keys():
-                shape_list.append(dict_plate[f'{shape_id}'])
-                continue
-        group_dict[f'{name}'] = {'name': name,
-                                 'shapes': shape_list}
+            shape = dict_beam.get(shape_id)
+            if shape is None:
+                shape = dict_plate.get(shape_id)
+            if shape is not None:
+                shape_list.append(shape)
+        group_dict[name] = {'name': name,
+                         'shapes': shape_list}
         group = Group.from_staad(input_dict={'name': name,
                                              'shapes': shape_list},
                                  project=project)
 
     ## SUPPORTS ##
     dict_supports = dict()
-    dict_plate_node_geo = dict()
-    dict_member_node_geo = dict()
-    for beam in staad_data.member_incidences:
-        node_no_start = staad_data.member_incidences[beam]['start_node_ID']
-        dict_member_node_geo.update({node_no_start: beam})
-        node_no_end = staad_data.member_incidences[beam]['end_node_ID']
-        dict_member_node_geo.update({node_no_end: beam})
-
+    # Collect the beam and the end of the beam to which a node belongs, the first beam found is used
+    node_to_beam_endpoint = dict()
+    for beam, beam_nodes in staad_data.member_incidences.items():
+        node_to_beam_endpoint.setdefault(beam_nodes['start_node_ID'], (beam, 'start'))
+        node_to_beam_endpoint.setdefault(beam_nodes['end_node_ID'], (beam, 'end'))
+    # Collect the plate and the node of its contour for the coordinates of the corners of the plates
+    node_to_plate_line = dict()
     for shell in staad_data.element_incidences_shell:
-        dict_plate_node_geo.update({staad_data.element_incidences_shell[shell]['node_1']: shell})
-        dict_plate_node_geo.update({staad_data.element_incidences_shell[shell]['node_2']: shell})
-        dict_plate_node_geo.update({staad_data.element_incidences_shell[shell]['node_3']: shell})
-        dict_plate_node_geo.update({staad_data.element_incidences_shell[shell]['node_4']: shell})
+        for line in dict_plate[shell].contour.lines:
+            node_to_plate_line.setdefault(tuple(line.node_start.coordinates), (dict_plate[shell], line.node_start))
+            node_to_plate_line.setdefault(tuple(line.node_end.coordinates), (dict_plate[shell], line.node_end))
 
     for support in staad_data.supports:
 
@@ -2711,57 +2818,10 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
                     input_dict = dict()
 
                     # Check the node to which beam or plate it belongs
-
-                    if node_id in dict_member_node_geo.keys():
-                        beam_id = dict_member_node_geo[node_id]
-                        if staad_data.member_incidences[beam_id]['start_node_ID'] == node_id:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': dict_beam[beam_id],
-                                'shape_geometry': dict_beam[beam_id].contour.node_start}]
-                        else:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': dict_beam[beam_id],
-                                'shape_geometry': dict_beam[beam_id].contour.node_end}]
-                    elif node_id in dict_plate_node_geo.keys():
-
-                        plate_ID = dict_plate_node_geo[node_id]
-
-                        connecting_shape = dict_plate[plate_ID]
-
-                        node_id_coordinates = staad_data.joint_coordinates[node_id]
-
-                        if dict_plate[plate_ID].contour.lines[0].node_start.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[0].node_start}]
-                        elif dict_plate[plate_ID].contour.lines[0].node_end.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[0].node_end}]
-                        elif dict_plate[plate_ID].contour.lines[1].node_start.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[1].node_start}]
-                        elif dict_plate[plate_ID].contour.lines[1].node_end.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[1].node_end}]
-                        elif dict_plate[plate_ID].contour.lines[2].node_start.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[2].node_start}]
-                        elif dict_plate[plate_ID].contour.lines[2].node_end.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[2].node_end}]
-                        elif dict_plate[plate_ID].contour.lines[3].node_start.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[3].node_start}]
-                        elif dict_plate[plate_ID].contour.lines[3].node_end.coordinates == node_id_coordinates:
-                            input_dict['connecting_items'] = [{
-                                'connecting_shape': connecting_shape,
-                                'shape_geometry': dict_plate[plate_ID].contour.lines[3].node_end}]
+                    connecting_items = _make_connecting_items(
+                        node_id, node_to_beam_endpoint, node_to_plate_line, dict_beam, staad_data)
+                    if connecting_items is not None:
+                        input_dict['connecting_items'] = connecting_items
 
                     d_kx = 1
                     d_ky = 1
@@ -2819,55 +2879,10 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
                 input_dict = dict()
 
                 # Check the node to which beam or plate it belongs
-                if node_id in dict_member_node_geo.keys():
-                    beam_id = dict_member_node_geo[node_id]
-                    if staad_data.member_incidences[beam_id]['start_node_ID'] == node_id:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': dict_beam[beam_id],
-                            'shape_geometry': dict_beam[beam_id].contour.node_start}]
-                    else:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': dict_beam[beam_id],
-                            'shape_geometry': dict_beam[beam_id].contour.node_end}]
-                elif node_id in dict_plate_node_geo.keys():
-
-                    plate_ID = dict_plate_node_geo[node_id]
-
-                    connecting_shape = dict_plate[plate_ID]
-                    support_node_coordinates = str(staad_data.joint_coordinates[node_id])
-
-                    if str(dict_plate[plate_ID].contour.lines[0].node_start.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[0].node_start}]
-                    elif str(dict_plate[plate_ID].contour.lines[0].node_end.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[0].node_end}]
-                    elif str(dict_plate[plate_ID].contour.lines[1].node_start.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[1].node_start}]
-                    elif str(dict_plate[plate_ID].contour.lines[1].node_end.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[1].node_end}]
-                    elif str(dict_plate[plate_ID].contour.lines[2].node_start.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[2].node_start}]
-                    elif str(dict_plate[plate_ID].contour.lines[2].node_end.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[2].node_end}]
-                    elif str(dict_plate[plate_ID].contour.lines[3].node_start.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[3].node_start}]
-                    elif str(dict_plate[plate_ID].contour.lines[3].node_end.coordinates) == support_node_coordinates:
-                        input_dict['connecting_items'] = [{
-                            'connecting_shape': connecting_shape,
-                            'shape_geometry': dict_plate[plate_ID].contour.lines[3].node_end}]
+                connecting_items = _make_connecting_items(
+                    node_id, node_to_beam_endpoint, node_to_plate_line, dict_beam, staad_data)
+                if connecting_items is not None:
+                    input_dict['connecting_items'] = connecting_items
 
                 if support == 'FIXED':
                     input_dict['degrees_of_freedom'] = [[1, 1, 1], [1, 1, 1]]
@@ -2882,18 +2897,46 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
                     raise NotImplementedError(f'ERROR: Support {support} can not be implemented.')
 
     ## LOADS ##
+    # The global directions are the same for all loads, each is created for the first load that needs it and is used
+    # for the next loads in that direction. The axes 'GX', 'GY' and 'GZ' are the same as the axes 'X', 'Y' and 'Z'
+    global_dirs = dict()
+
+    def _global_direction(axis: str):
+        axis = axis[-1]
+        if axis not in global_dirs:
+            global_dirs[axis] = Direction.from_staad(input_dict={'direction_def': axis}, project=project)
+        return global_dirs[axis]
+
+    # The local axes of the beams are determined once per beam, also when multiple member loads are applied
+    beam_axes = dict()
+
+    def _beam_axis(beam_id: str, axis: str):
+        if (beam_id, axis) not in beam_axes:
+            if axis == 'x':
+                beam_axes[(beam_id, axis)] = dict_beam[beam_id].contour.get_direction()
+            elif axis == 'y':
+                beam_axes[(beam_id, axis)] = dict_beam[beam_id].y_axis_direction()
+            else:
+                beam_axes[(beam_id, axis)] = dict_beam[beam_id].z_axis_direction()
+        return beam_axes[(beam_id, axis)]
+
     loadgroups = {}
     loadcases = {}
     repeat_load_counter = 0
+    # Load cases with only a repeat load are not created, factors on these are resolved into the factors of the repeat
+    repeat_only_factors = {
+        int(key): value['load_items']['REPEAT LOAD']['factors']
+        for key, value in staad_data.primary_loadcases.items()
+        if len(value['load_items']) == 1 and 'REPEAT LOAD' in value['load_items']}
     # Create the primary load cases
     for key, value in staad_data.primary_loadcases.items():
         loaditems = value.get('load_items')
         id = int(key)
         name = value.get('load_name')
         loadgroupname = value.get('load_type')
-        if (not loadgroups) or (loadgroupname not in loadgroups):
+        if loadgroupname not in loadgroups:
             loadgroups[loadgroupname] = project.create_loadgroup(name=loadgroupname)
-        input_loadcase = {'id': int(id), 'name': name, 'loadgroup': loadgroups[loadgroupname]}
+        input_loadcase = {'id': id, 'name': name, 'loadgroup': loadgroups[loadgroupname]}
 
         # Dont create load case if its just repeat load in the loadcase
         if len(loaditems) == 1 and 'REPEAT LOAD' in loaditems.keys():
@@ -2912,225 +2955,60 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
                                   'load_value': value_item2.get('factor')}
                     ModelLoad.from_staad(input_dict=input_dict, project=project)
             elif key_item in ['JOINT LOAD', 'SUPPORT DISPLACEMENT LOAD']:
+                if key_item == 'JOINT LOAD':
+                    load_type = 'force'
+                    load_type_moment = 'moment'
+                else:
+                    load_type = 'translation'
+                    load_type_moment = 'rotation'
                 for key_item2, value_item2 in value_item.items():
-                    for id_node in value_item2.get('assigned_members'):
-                        id_node_coordinates = staad_data.joint_coordinates[id_node]
-                        if key_item == 'JOINT LOAD':
-                            load_type = 'force'
-                            load_type_moment = 'moment'
-                        else:
-                            load_type = 'translation'
-                            load_type_moment = 'rotation'
-                        # check the node belongs to which beam?
-                        for beam in staad_data.member_incidences:
-                            if id_node in staad_data.member_incidences[beam].values():
-
-                                if staad_data.member_incidences[beam]['start_node_ID'] == id_node:
-                                    connecting_items = [{
-                                        'connecting_shape': dict_beam[beam],
-                                        'shape_geometry': dict_beam[beam].contour.node_start}]
-                                    break
-                                else:
-                                    connecting_items = [{
-                                        'connecting_shape': dict_beam[beam],
-                                        'shape_geometry': dict_beam[beam].contour.node_end}]
-                                break
-
-                        if "connecting_items" not in locals():
-                            for shell in staad_data.element_incidences_shell:
-                                if id_node in staad_data.element_incidences_shell[shell].values():
-                                    for line in dict_plate[shell].contour.lines:
-                                        if line.node_start.coordinates == id_node_coordinates:
-                                            connecting_items = [{
-                                                'connecting_shape': dict_plate[shell],
-                                                'shape_geometry': line.node_start}]
-                                            break
-                                        elif line.node_end.coordinates == id_node_coordinates:
-                                            connecting_items = [{
-                                                'connecting_shape': dict_plate[shell],
-                                                'shape_geometry': line.node_end}]
-                                            break
-
-                        if 'FX' in value_item2 and value_item2.get('FX') is not None:
-                            input_dict = {'load_type': load_type,
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'X'}, project=project),
-                                          'load_value': float(value_item2.get('FX')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            PointLoad.from_staad(input_dict=input_dict, project=project)
-
-                        if 'FY' in value_item2 and value_item2.get('FY') is not None:
-                            input_dict = {'load_type': load_type,
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Y'}, project=project),
-                                          'load_value': float(value_item2.get('FY')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            PointLoad.from_staad(input_dict=input_dict, project=project)
-
-                        if 'FZ' in value_item2 and value_item2.get('FZ') is not None:
-                            input_dict = {'load_type': load_type,
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Z'}, project=project),
-                                          'load_value': float(value_item2.get('FZ')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            PointLoad.from_staad(input_dict=input_dict, project=project)
-
-                        if 'MX' in value_item2 and value_item2.get('MX') is not None:
-                            input_dict = {'load_type': load_type_moment,
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'X'}, project=project),
-                                          'load_value': float(value_item2.get('MX')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            PointLoad.from_staad(input_dict=input_dict, project=project)
+                    # Collect the input of the components of the load, these are the same for all assigned nodes
+                    load_components = []
+                    for component, axis, moment in _JOINT_LOAD_COMPONENTS:
+                        load_value = value_item2.get(component)
+                        if load_value is not None:
+                            load_components.append({'load_type': load_type_moment if moment else load_type,
+                                                    'direction': _global_direction(axis),
+                                                    'load_value': float(load_value),
+                                                    'load_case': loadcase})
 
-                        if 'MY' in value_item2 and value_item2.get('MY') is not None:
-                            input_dict = {'load_type': load_type_moment,
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Y'}, project=project),
-                                          'load_value': float(value_item2.get('MY')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            PointLoad.from_staad(input_dict=input_dict, project=project)
+                    for id_node in value_item2.get('assigned_members'):
+                        # Check the node to which beam or plate it belongs
+                        connecting_items = _make_connecting_items(
+                            id_node, node_to_beam_endpoint, node_to_plate_line, dict_beam, staad_data)
 
-                        if 'MZ' in value_item2 and value_item2.get('MZ') is not None:
-                            input_dict = {'load_type': load_type_moment,
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Z'}, project=project),
-                                          'load_value': float(value_item2.get('MZ')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
+                        for load_input in load_components:
+                            input_dict = dict(load_input, connecting_items=connecting_items)
                             PointLoad.from_staad(input_dict=input_dict, project=project)
 
             elif key_item == 'MEMBER LOAD':
                 for key_item2, value_item2 in value_item.items():
+                    # Only loads on the full length of the member are converted
+                    load_entry = _MEMBER_LOAD_DISPATCH.get(
+                        (value_item2.get('load_type'), value_item2.get('direction')))
+                    if load_entry is None or \
+                            value_item2.get('d1') or value_item2.get('d2') or value_item2.get('d3'):
+                        continue
+                    load_type, value_key, axis = load_entry
+                    # The direction is set per beam, for loads in the local axes it depends on the beam
+                    load_input = {'load_type': load_type,
+                                  'load_value': float(value_item2.get(value_key)),
+                                  'load_case': loadcase}
                     for id_member in value_item2.get('assigned_members'):
                         # Find beam for load
-                        for beam in staad_data.member_incidences:
-                            if id_member == beam:
-                                connecting_items = [{'connecting_shape': dict_beam[beam]}]
-                                break
-                        if value_item2.get('load_type') == 'uniform_force' and value_item2.get('direction') == 'GX':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'force',
-                                              'direction':
-                                                  Direction.from_staad(
-                                                      input_dict={'direction_def': 'X'}, project=project),
-                                              'load_value': float(value_item2.get('force')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_force' and value_item2.get('direction') == 'GY':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'force',
-                                              'direction':
-                                                  Direction.from_staad(
-                                                      input_dict={'direction_def': 'Y'}, project=project),
-                                              'load_value': float(value_item2.get('force')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-
-                        elif value_item2.get('load_type') == 'uniform_force' and value_item2.get('direction') == 'GZ':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'force',
-                                              'direction':
-                                                  Direction.from_staad(
-                                                      input_dict={'direction_def': 'Z'}, project=project),
-                                              'load_value': float(value_item2.get('force')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_force' and value_item2.get('direction') == 'X':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'force',
-                                              'direction': dict_beam[beam].contour.get_direction(),
-                                              'load_value': float(value_item2.get('force')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_force' and value_item2.get('direction') == 'Y':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'force',
-                                              'direction': dict_beam[beam].y_axis_direction(),
-                                              'load_value': float(value_item2.get('force')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-
-                        elif value_item2.get('load_type') == 'uniform_force' and value_item2.get('direction') == 'Z':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'force',
-                                              'direction': dict_beam[beam].z_axis_direction(),
-                                              'load_value': float(value_item2.get('force')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'GX':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'moment',
-                                              'direction':
-                                                  Direction.from_staad(
-                                                      input_dict={'direction_def': 'X'}, project=project),
-                                              'load_value': float(value_item2.get('moment')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'GY':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'moment',
-                                              'direction':
-                                                  Direction.from_staad(
-                                                      input_dict={'direction_def': 'Y'}, project=project),
-                                              'load_value': float(value_item2.get('moment')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'GZ':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'moment',
-                                              'direction':
-                                                  Direction.from_staad(
-                                                      input_dict={'direction_def': 'Z'}, project=project),
-                                              'load_value': float(value_item2.get('moment')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'X':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'moment',
-                                              'direction': dict_beam[beam].contour.get_direction(),
-                                              'load_value': float(value_item2.get('moment')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'Y':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'moment',
-                                              'direction': dict_beam[beam].y_axis_direction(),
-                                              'load_value': float(value_item2.get('moment')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
-
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'Z':
-                            if not value_item2.get('d1') and not value_item2.get('d2') and not value_item2.get('d3'):
-                                input_dict = {'load_type': 'moment',
-                                              'direction': dict_beam[beam].z_axis_direction(),
-                                              'load_value': float(value_item2.get('moment')),
-                                              'load_case': loadcase,
-                                              'connecting_items': connecting_items}
-                                LineLoad.from_staad(input_dict=input_dict, project=project)
+                        if id_member not in dict_beam:
+                            continue
+                        input_dict = dict(load_input, connecting_items=[{'connecting_shape': dict_beam[id_member]}])
+                        if axis in ('x', 'y', 'z'):
+                            input_dict['direction'] = _beam_axis(id_member, axis)
+                        else:
+                            input_dict['direction'] = _global_direction(axis)
+                        LineLoad.from_staad(input_dict=input_dict, project=project)
             elif key_item == 'REPEAT LOAD':
-                group = {}
-                for key_factors, value_factors in value_item.get('factors').items():
-                    load_case = loadcases[int(key_factors)]
-                    group[load_case] = value_factors
                 repeat_load_counter += 1
+                group = _resolve_load_factors(
+                    project, value_item.get('factors'), loadcases, repeat_only_factors,
+                    f'Non Linear Load Combination {repeat_load_counter}')
                 input_dict = {'id': id,
                               'name': f'Non Linear Load Combination {repeat_load_counter}',
                               'non_linear_combination': True,
@@ -3139,88 +3017,73 @@ def _fem_staad_to_fem(project: 'Project', std_file: Union[str, Path]):
                 LoadCombination.from_staad(input_dict, project)
             elif key_item == 'ELEMENT LOAD':
                 for key_item2, value_item2 in value_item.items():
+                    load_entry = _ELEMENT_LOAD_DISPATCH.get(
+                        (value_item2.get('load_type'), value_item2.get('direction')))
+                    if load_entry is None:
+                        continue
+                    load_type, value_key, axis = load_entry
+                    load_input = {'load_type': load_type,
+                                  'direction': _global_direction(axis),
+                                  'load_value': float(value_item2.get(value_key)),
+                                  'load_case': loadcase}
                     for id_member in value_item2.get('assigned_members'):
 
                         # Find surface for load
-                        for plate in staad_data.element_incidences_shell:
-                            if id_member == plate:
-                                connecting_items = [{'connecting_shape': dict_plate[plate]}]
-                                break
-                        if value_item2.get('load_type') == 'pressure_on_full_plate' and \
-                                value_item2.get('direction') == 'GX':
-                            input_dict = {'load_type': 'force',
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'X'}, project=project),
-                                          'load_value': float(value_item2.get('force')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            SurfaceLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'pressure_on_full_plate' and \
-                                value_item2.get('direction') == 'GY':
-                            input_dict = {'load_type': 'force',
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Y'}, project=project),
-                                          'load_value': float(value_item2.get('force')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            SurfaceLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'pressure_on_full_plate' and \
-                                value_item2.get('direction') == 'GZ':
-                            input_dict = {'load_type': 'force',
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Z'}, project=project),
-                                          'load_value': float(value_item2.get('force')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            SurfaceLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'GX':
-                            input_dict = {'load_type': 'force',
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'X'}, project=project),
-                                          'load_value': float(value_item2.get('moment')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            SurfaceLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'GY':
-                            input_dict = {'load_type': 'force',
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Y'}, project=project),
-                                          'load_value': float(value_item2.get('moment')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            SurfaceLoad.from_staad(input_dict=input_dict, project=project)
-                        elif value_item2.get('load_type') == 'uniform_moment' and value_item2.get('direction') == 'GZ':
-                            input_dict = {'load_type': 'force',
-                                          'direction':
-                                              Direction.from_staad(input_dict={'direction_def': 'Z'}, project=project),
-                                          'load_value': float(value_item2.get('moment')),
-                                          'load_case': loadcase,
-                                          'connecting_items': connecting_items}
-                            SurfaceLoad.from_staad(input_dict=input_dict, project=project)
-
-    category = None
+                        if id_member not in dict_plate:
+                            continue
+                        input_dict = dict(load_input, connecting_items=[{'connecting_shape': dict_plate[id_member]}])
+                        SurfaceLoad.from_staad(input_dict=input_dict, project=project)
+
+    # Collect the category of the load combinations from the envelopes
+    combo_to_category = {
+        combo: envelope_name for envelope_name, envelope_value in staad_data.envelopes.items()
+        for combo in envelope_value['combo_list']}
     for key, value in staad_data.load_combinations.items():
         id = int(key)
         name = value.get('loadcomb_name')
-        group = {}
-        for key_factors, value_factors in value.get('factors').items():
-            load_case = loadcases[int(key_factors)]
-            group[load_case] = value_factors
-        # Find category
-        for envelope_name, envelope_value in staad_data.envelopes.items():
-            if key in envelope_value['combo_list']:
-                category = envelope_name
+        group = _resolve_load_factors(project, value.get('factors'), loadcases, repeat_only_factors, name)
         input_dict = {'id': id,
                       'name': name,
                       'factors': group,
-                      'category': category}
+                      'category': combo_to_category.get(key)}
         LoadCombination.from_staad(input_dict, project)
 
+    return dict_meshnode, dict_beam
+
 
 ### ===================================================================================================================
 ###   5. Run analysis in STAAD
 ### ===================================================================================================================
 
+# Default locations of the STAAD exe file, in order of preference
+_STAAD_EXE_DEFAULT_PATHS = (
+    Path(r"C:\Program Files (x86)\SProV8i SS6\STAAD\SProStaad\SProStaad.exe"),
+    Path(r"C:\Program Files\Bentley\Engineering\STAAD.Pro CONNECT Edition\STAAD\SProStaad\SProStaad.exe"))
+
+# Location of the STAAD exe file found in the default locations, retrieved on first use
+_STAAD_EXE_CACHE: Optional[Path] = None
+
+
+def _resolve_staad_exe() -> Optional[Path]:
+    """
+    Function to find the STAAD exe file in the default locations. The location found is stored and reused for next
+    analyses.
+
+    Input:
+        - No input required.
+
+    Output:
+        - Returns the path of the STAAD exe file. None is returned if STAAD is not present in the default locations.
+    """
+    global _STAAD_EXE_CACHE
+    if _STAAD_EXE_CACHE is None:
+        for default_path in _STAAD_EXE_DEFAULT_PATHS:
+            if default_path.exists():
+                _STAAD_EXE_CACHE = default_path
+                break
+    return _STAAD_EXE_CACHE
+
+
 def _fem_run_model_staad(project: 'Project', std_input_file: Union[str, Path], folder: str = None,
                          location_exe_file: Union[str, Path] = None):
     """
@@ -3290,15 +3153,7 @@ def _fem_run_model_staad(project: 'Project', std_input_file: Union[str, Path], f
 
     else:
         # Get the default path to use STAAD
-
-        default_paths = [
-            Path(r"C:\Program Files (x86)\SProV8i SS6\STAAD\SProStaad\SProStaad.exe"),
-            Path(r"C:\Program Files\Bentley\Engineering\STAAD.Pro CONNECT Edition\STAAD\SProStaad\SProStaad.exe")]
-        path_staad = None
-        for default_path in default_paths:
-            if default_path.exists():
-                path_staad = default_path
-                break
+        path_staad = _resolve_staad_exe()
         if path_staad is None:
             project.write_log(
                 f"WARNING: Provide the location of the STAAD exe file in input for 'location_exe_file'.")
@@ -3313,6 +3168,15 @@ def _fem_run_model_staad(project: 'Project', std_input_file: Union[str, Path], f
 ###   6. Get results from STAAD
 ### ===================================================================================================================
 
+# Reads the IDs of the start and end node from the member incidences of a member
+_member_end_nodes = itemgetter('start_node_ID', 'end_node_ID')
+
+# Components of the results of STAAD, in the order of the values returned by OpenSTAAD (x, y, z, rx, ry, rz)
+_RESULT_COMPONENTS = (
+    ('translation', 'x'), ('translation', 'y'), ('translation', 'z'),
+    ('rotation', 'x'), ('rotation', 'y'), ('rotation', 'z'))
+
+
 class GetResults(RawStdFile):
     """
     Class to get internal forces from the STAAD-model, inherits from RawStdFile class to use .std as objects.
@@ -3339,45 +3203,84 @@ class GetResults(RawStdFile):
                 "ERROR: Cannot make connection to STAAD API to get results. Python modules 'comtypes' is missing.")
             return
 
+        # The output of the API calls needs to be stored in a C++ array, this array is created once and reused
+        self._create_result_buffer()
+
         # Check if Staad is open, if not run _open_staad_file() method
         # Connect to OpenSTAAD and prepare methods which will be used
+        staad_ready_time = None
         try:
             self._connect_openstaad()
-            time.sleep(15)
+            staad_ready_time = time.monotonic() + 15
             project.write_log(
-                f"WARNING: STAAD is opening. Giving STAAD 15 seconds to open so that it is in a suitable state to open "
-                f"and retrieve results.")
+                f"WARNING: STAAD is opening. Giving STAAD up to 15 seconds to open so that it is in a suitable state "
+                f"to open and retrieve results.")
         except OSError:
             self.staad_opened = False
             self._open_staad_file()
 
-        # Read .std file and store in dictionary
+        # Read .std file and store in dictionary, meanwhile STAAD gets the time to open
         self.read_file()
-        _fem_staad_to_fem(self.project, self.std_file)
+        self._mesh_nodes, self._member_shapes = _fem_staad_to_fem(self.project, self.std_file)
+
+        # Wait until STAAD responds, at most for the remainder of the time given to STAAD to open
+        if staad_ready_time is not None:
+            self._wait_for_staad(staad_ready_time)
 
-    def _open_staad_file(self):
+    def _open_staad_file(self, max_wait_time: float = 60):
         """
-        Method to open STAAD, and activate methods for OpenSTAAD, tries up until Staad is opened.
+        Method to open STAAD, and activate methods for OpenSTAAD. The connection is tried every 0.1 seconds, until
+        STAAD is opened or the maximum time to wait is up.
 
         .. note:: This method is called while instantiating the class.
 
         Input:
-            - No input required.
+            - max_wait_time (float): Maximum time in seconds to wait for STAAD to open. Default value is 60 seconds.
 
         Output:
             - Opens STAAD.
             - Connection is made to OpenSTAAD.
+            - Raises a TimeoutError if no connection could be made within the maximum time to wait, this is also
+              logged.
         """
-        if self.staad_opened:
-            try:
-                self._connect_openstaad()
-            except:
-                time.sleep(0.01)
-                self._open_staad_file()
-        else:
+        if not self.staad_opened:
             os.startfile(self.std_file)
             self.staad_opened = True
-            self._open_staad_file()
+        deadline = time.monotonic() + max_wait_time
+        while True:
+            try:
+                self._connect_openstaad()
+                return
+            except (OSError, comtypes.COMError):
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.1)
+        message = f"ERROR: Could not connect to STAAD within {max_wait_time} seconds to retrieve the results of " \
+                  f"{self.std_file}."
+        self.project.write_log(message)
+        raise TimeoutError(message)
+
+    def _wait_for_staad(self, staad_ready_time: float):
+        """
+        Method to wait until STAAD responds to requests for results. The displacement of the first node for the first
+        load case is requested every 0.1 seconds, until the request succeeds or the time is up.
+
+        Input:
+            - staad_ready_time (float): Time (of time.monotonic) until which the method waits for STAAD.
+
+        Output:
+            - Returns when STAAD responds, or when the time is up.
+        """
+        probe_node = next(iter(self.joint_coordinates), None)
+        probe_load_case = next(iter({**self.primary_loadcases, **self.load_combinations}), None)
+        while time.monotonic() < staad_ready_time:
+            if probe_node is not None and probe_load_case is not None:
+                try:
+                    self.output.GetNodeDisplacements(int(probe_node), int(probe_load_case), self._result_variant)
+                    return
+                except (comtypes.COMError, OSError):
+                    pass
+            time.sleep(0.1)
 
     def _connect_openstaad(self):
         """ Open STAAD. """
@@ -3387,6 +3290,100 @@ class GetResults(RawStdFile):
         self.output._FlagAsMethod("GetSupportReactions")
         self.output._FlagAsMethod("GetNodeDisplacements")
 
+    def _create_result_buffer(self):
+        """
+        Method to create the array in which OpenSTAAD stores the results of an API call. All API calls used return six
+        values, the same array is used for all calls.
+
+        Input:
+            - No input required.
+
+        Output:
+            - The safe array is stored in attribute '_result_safe_array', the reference to it for the API calls in
+              attribute '_result_variant'.
+        """
+        self._result_safe_array = self._make_safe_array(6)
+        self._result_variant = self._make_variant_vt_ref(
+            self._result_safe_array, comtypes.automation.VT_ARRAY | comtypes.automation.VT_R8)
+
+    def _create_mesh_nodes_dictionary(self):
+        """
+        Method of 'GetResults' to create a dictionary of the mesh_node objects and the mesh_node_id. The mesh nodes
+        created for the joints when converting the model are used, instead of searching all mesh nodes of the project.
+        """
+        self.mesh_node_object_dict = {int(node_id): mesh_node for node_id, mesh_node in self._mesh_nodes.items()}
+
+    def _create_load_combination_case_dictionary(self):
+        """
+        Method of 'GetResults' to create a dictionary of the load_case and load_combination objects of the
+        project.collections and the load id.
+
+        Input:
+            - No input required.
+
+        Output:
+            - load_combination_case_object_dictionary(dict) : {load_case/load_combination.id:load_object}
+        """
+        collections = self.project.collections
+        self.load_combination_case_dict = {
+            load_object.id: load_object
+            for load_objects in (collections.loadcases, collections.loadcombinations) for load_object in load_objects}
+
+    def _create_member_dictionary(self):
+        """
+        Method of 'GetResults' to create a dictionary of the beam/pile members objects and the member id. The shapes
+        created for the members when converting the model are used, instead of searching all shapes of the project.
+        """
+        self.member_dict = {int(member_id): member for member_id, member in self._member_shapes.items()}
+
+    def _create_member_node_ids_dictionary(self):
+        """
+        Method of 'GetResults' to create a dictionary of the IDs of the start and end node of the members.
+
+        Input:
+            - No input required.
+
+        Output:
+            - self.member_node_ids (dict): {member_id: (start_node_id, end_node_id)}, with the node IDs as integers.
+        """
+        self.member_node_ids = {
+            member_id: tuple(map(int, _member_end_nodes(member_nodes)))
+            for member_id, member_nodes in self.member_incidences.items()}
+
+    def _results_direction_conversion(self, results: dict) -> dict:
+        """
+        Method of 'GetResults' to convert the direction of the results. The vertical direction is the same for all
+        results of the model, so it is checked once for all results.
+
+        Input:
+            - results (dict): Results of the STAAD model, the values are tuples of the translational and rotational
+              components (x, y, z, rx, ry, rz).
+
+        Output:
+            - Returns the results following the default direction (Z) in FEM schema. The values are replaced in the
+              provided dictionary, no copy of the results is made.
+        """
+        if self.direction['direction'] != "Y":
+            return results
+        # Vertical Y-axis in STAAD becomes the Z-axis, the Z-axis of STAAD becomes the negative Y-axis
+        for key, values in results.items():
+            results[key] = (values[0], -values[2], values[1], values[3], -values[5], values[4])
+        return results
+
+    def _create_result_dictionaries(self, mesh_node: 'MeshNode', values: tuple) -> list:
+        """
+        Method of 'GetResults' to create the result dictionaries of all components of a result for a mesh node.
+
+        Input:
+            - mesh_node (obj): MeshNode object where the result is located.
+            - values (tuple): Values of the result components, for example (dx, dy, dz, rx, ry, rz).
+
+        Output:
+            - Returns a list with a result dictionary per component, in the order of the values.
+        """
+        create_result_dictionary = self.project.create_result_dictionary
+        return [create_result_dictionary([mesh_node, value]) for value in values]
+
     @staticmethod
     def _make_safe_array(size):
         """ Method to create safe array as input for OpenStAAD API (provided by Bentley). """
@@ -3435,9 +3432,7 @@ class GetInternalForces(GetResults):
             - No input required.
 
         Output:
-            - self.members_internal_forces_list (dict): {member_id : member_id, node_nr: node_nr,
-            load_case_id: load_case_id, internal_forces:internal_forces,
-            internal_force_specific:internal_force_specific}
+            - self.members_internal_forces_dict (dict): {(member_id, node_nr, load_case_id): (fx, fy, fz, mx, my, mz)}
         """
         node_1 = 0
         node_2 = 1
@@ -3446,28 +3441,23 @@ class GetInternalForces(GetResults):
         # Join load_cases together in one dictionary
         self.load_cases = {**self.primary_loadcases, **self.load_combinations}
         members_internal_forces = {}
-        i = 0
+
+        # Collect the input for all API calls, STAAD handles the requests of OpenSTAAD one at a time
+        # The IDs are converted to the integers required by the API once per member and load case
+        member_nrs = [(member_id, int(member_id)) for member_id in self.member_incidences]
+        load_case_nrs = [(load_case_id, int(load_case_id)) for load_case_id in self.load_cases]
+        api_calls = [(member_id, member_nr, node, load_case_id, load_case_nr)
+                     for member_id, member_nr in member_nrs for node in nodes
+                     for load_case_id, load_case_nr in load_case_nrs]
 
         # Perform the API call
-        for member_id, member_nodes in self.member_incidences.items():
-            for node in nodes:
-                for load_case_id, load_properties in self.load_cases.items():
-                    member_end_forces = self._create_api_call(int(member_id), int(node), int(load_case_id))
-                    members_internal_forces[i] = {'member_id': member_id,
-                                                  'node_nr': node,
-                                                  'load_case_id': load_case_id,
-                                                  "fx": member_end_forces[0],
-                                                  "fy": member_end_forces[1],
-                                                  "fz": member_end_forces[2],
-                                                  'mx': member_end_forces[3],
-                                                  'my': member_end_forces[4],
-                                                  'mz': member_end_forces[5]
-                                                  }
-                    i += 1
-                    self.members_internal_forces_dict.update(members_internal_forces)
+        for member_id, member_nr, node, load_case_id, load_case_nr in api_calls:
+            members_internal_forces[(member_id, node, load_case_id)] = self._create_api_call(
+                member_nr, node, load_case_nr)
+        self.members_internal_forces_dict = members_internal_forces
         self._create_internal_force_fem_object()
 
-    def _create_api_call(self, member_id: int, node_nr: int, load_case_id: int) -> List:
+    def _create_api_call(self, member_id: int, node_nr: int, load_case_id: int) -> tuple:
         """
         Method of 'GetInternalForces' to make the API call.
 
@@ -3477,16 +3467,11 @@ class GetInternalForces(GetResults):
             - load_case_id(int): load case ID derived from .std model objects.
 
         Output:
-            - Returns the member end forces as a list of end forces sorted on [fx, fy, fz, mx, my, mz].
+            - Returns the member end forces as a tuple of end forces sorted on (fx, fy, fz, mx, my, mz).
         """
-        # The output inputs need to be stored in a C++ array, these methods are used to get access to create this array
-        member_end_forces_safe_array = self._make_safe_array(6)
-        member_end_forces = self._make_variant_vt_ref(member_end_forces_safe_array,
-                                                      comtypes.automation.VT_ARRAY | comtypes.automation.VT_R8)
-
-        # This calls a function to get internal forces from STAAD
-        self.output.GetMemberEndForces(member_id, node_nr, load_case_id, member_end_forces)
-        return member_end_forces[0]
+        # This calls a function to get internal forces from STAAD, the output is stored in the result array
+        self.output.GetMemberEndForces(member_id, node_nr, load_case_id, self._result_variant)
+        return self._result_variant[0]
 
     def _create_internal_force_fem_object(self):
         """
@@ -3498,17 +3483,15 @@ class GetInternalForces(GetResults):
         self._create_load_combination_case_dictionary()
         self._create_member_dictionary()
 
-        for keys, member_internal_forces in self.members_internal_forces_dict.items():
-            member_dict = self.member_incidences[member_internal_forces['member_id']]
-            member = self.member_dict[int(member_internal_forces['member_id'])]
-            load = self.load_combination_case_dict[int(member_internal_forces['load_case_id'])]
-            node_nr = member_internal_forces['node_nr']
-            if node_nr == 0:
-                node_id = int(member_dict["start_node_ID"])
-                self._get_shape_results(load, member, member_internal_forces, node_id)
-            if node_nr == 1:
-                node_id = int(member_dict["end_node_ID"])
-                self._get_shape_results(load, member, member_internal_forces, node_id)
+        # Collect the shape and the IDs of the start and end node per member, and the load object per load case
+        self._create_member_node_ids_dictionary()
+        member_ends = {member_id: (self.member_dict[int(member_id)], node_ids)
+                       for member_id, node_ids in self.member_node_ids.items()}
+        loads = {load_case_id: self.load_combination_case_dict[int(load_case_id)] for load_case_id in self.load_cases}
+
+        for (member_id, node_nr, load_case_id), member_internal_forces in self.members_internal_forces_dict.items():
+            member, node_ids = member_ends[member_id]
+            self._get_shape_results(loads[load_case_id], member, member_internal_forces, node_ids[node_nr])
 
     def _get_shape_results(self, load_object: Union['LoadCase', 'LoadCombination'], member: 'Shapes',
                            member_internal_forces: dict, node_id: int):
@@ -3518,16 +3501,17 @@ class GetInternalForces(GetResults):
         Input:
             - load_object (obj): LoadCase or LoadCombination
             - member (obj): Shapes
-            - member_internal_forces (dict): internal force dictionary
+            - member_internal_forces (tuple): internal forces (fx, fy, fz, mx, my, mz)
+            - node_id (int): ID of the mesh node of the member end
 
         Output:
             - objects are created in project.collections.shape_results
         """
-
-        result_dictionaries = self._create_result_dictionary(node_id, member_internal_forces)
-        for index, result_dictionary in enumerate(result_dictionaries):
-            self.project.create_shape_result(member, [[self.element_force_models[index], load_object, self.software,
-                                                       result_dictionary]])
+        result_dictionaries = self._create_result_dictionaries(
+            self.mesh_node_object_dict[node_id], member_internal_forces)
+        for element_force_model, result_dictionary in zip(self.element_force_models, result_dictionaries):
+            self.project.create_shape_result(
+                member, [[element_force_model, load_object, self.software, result_dictionary]])
 
     def _create_element_force_models(self):
         """
@@ -3550,65 +3534,6 @@ class GetInternalForces(GetResults):
                                      element_force_model_M_x, element_force_model_M_y,
                                      element_force_model_M_z]
 
-    def _create_result_dictionary(self, mesh_node_id: int, member_internal_forces: dict) -> List:
-        """
-        Method of 'GetInternalForces' to create the results dictionary based on the "ResultsDictionary" class
-
-        Input:
-            - mesh_node_id (str): ID of mesh_node derived from internal force dictionary
-            - member_internal_forces (dict): dictionary of internal forces
-            - mesh_node_object_dictionary(dict): dictionary with ID as key and mesh node object as value
-
-        Output:
-            - result_dictionary (list): list of Results Dictionary items
-        """
-
-        mesh_node = self.mesh_node_object_dict[mesh_node_id]
-        result_dictionary = [self.project.create_result_dictionary([mesh_node, member_internal_forces['fx']]),
-                             self.project.create_result_dictionary([mesh_node, member_internal_forces['fy']]),
-                             self.project.create_result_dictionary([mesh_node, member_internal_forces['fz']]),
-                             self.project.create_result_dictionary([mesh_node, member_internal_forces['mx']]),
-                             self.project.create_result_dictionary([mesh_node, member_internal_forces['my']]),
-                             self.project.create_result_dictionary([mesh_node, member_internal_forces['mz']])]
-        return result_dictionary
-
-    def _create_mesh_nodes_dictionary(self):
-        """
-        Method of 'GetInternalForces' to create a dictionary of the mesh_node objects of the project.collections and
-        the mesh_node_id
-        """
-
-        for mesh_node in self.project.collections.mesh_nodes:
-            self.mesh_node_object_dict[mesh_node.id] = mesh_node
-
-    def _create_load_combination_case_dictionary(self):
-        """
-        Method of 'GetInternalForces' to create a dictionary of the load_case and load_combination objects of the
-        project.collections and the load id
-
-        Input:
-            - No input required.
-
-        Output:
-            - load_combination_case_object_dictionary(dict) : {load_case/load_combination.id:load_object}
-        """
-
-        for load_case in self.project.collections.loadcases:
-            self.load_combination_case_dict[load_case.id] = load_case
-
-        for load_comb in self.project.collections.loadcombinations:
-            self.load_combination_case_dict[load_comb.id] = load_comb
-
-    def _create_member_dictionary(self):
-        """
-          Method of 'GetInternalForces' to create a dictionary of the beam/pile members objects of the
-          project.collections and the member id
-        """
-
-        for member in self.project.collections.shapes:
-            if 'Beam/Pile' in member.name:
-                self.member_dict[member.mesh.elements[0].id] = member
-
 
 class GetReactionForces(GetResults):
     """
@@ -3635,7 +3560,7 @@ class GetReactionForces(GetResults):
         self.software = "staad"
         self._get_reaction_forces()
 
-    def _create_api_call(self, node_nr: int, load_case_id: int) -> List:
+    def _create_api_call(self, node_nr: int, load_case_id: int) -> tuple:
         """
         Method of 'GetReactionForces' to make the API call.
 
@@ -3644,16 +3569,11 @@ class GetReactionForces(GetResults):
             - load_case_id(int): load case ID derived from .std model objects.
 
         Output:
-            - Returns the support reaction forces as a list of reaction forces sorted on [fx, fy, fz, mx, my, mz].
+            - Returns the support reaction forces as a tuple of reaction forces sorted on (fx, fy, fz, mx, my, mz).
         """
-        # The output inputs need to be stored in a C++ array, these methods are used to get access to create this array
-        reaction_forces_safe_array = self._make_safe_array(6)
-        reaction_forces = self._make_variant_vt_ref(reaction_forces_safe_array,
-                                                    comtypes.automation.VT_ARRAY | comtypes.automation.VT_R8)
-
-        # This calls a function to get internal forces from STAAD
-        self.output.GetSupportReactions(node_nr, load_case_id, reaction_forces)
-        return reaction_forces[0]
+        # This calls a function to get reaction forces from STAAD, the output is stored in the result array
+        self.output.GetSupportReactions(node_nr, load_case_id, self._result_variant)
+        return self._result_variant[0]
 
     def _get_reaction_forces(self):
         """
@@ -3663,8 +3583,7 @@ class GetReactionForces(GetResults):
             - No input required.
 
         Output:
-            - self.support_reaction_forces_list (dict): {node_nr: node_nr,
-            load_case_id: load_case_id, reaction_forces:reaction_forces}
+            - self.reaction_forces_dict (dict): {(node_nr, load_case_id): (fx, fy, fz, mx, my, mz)}
         """
 
         # Join load_cases together in one dictionary
@@ -3678,23 +3597,17 @@ class GetReactionForces(GetResults):
 
             else:
                 nodes = nodes + self.supports[key]
-        # Perform the API call
-        i = 0
-        for node in nodes:
-            for loadcase_id in self.load_cases:
-                reaction_forces = self._reaction_forces_conversion(self._create_api_call(int(node), int(loadcase_id)))
-                support_reaction_forces[i] = {'node_nr': node,
-                                              'load_case_id': loadcase_id,
-                                              "fx": reaction_forces[0],
-                                              "fy": reaction_forces[1],
-                                              "fz": reaction_forces[2],
-                                              'mx': reaction_forces[3],
-                                              'my': reaction_forces[4],
-                                              'mz': reaction_forces[5]
-                                              }
-                i += 1
+        # Collect the input for all API calls, STAAD handles the requests of OpenSTAAD one at a time
+        # The IDs are converted to the integers required by the API once per node and load case
+        node_nrs = [(node, int(node)) for node in nodes]
+        load_case_nrs = [(loadcase_id, int(loadcase_id)) for loadcase_id in self.load_cases]
+        api_calls = [(node, node_nr, loadcase_id, load_case_nr)
+                     for node, node_nr in node_nrs for loadcase_id, load_case_nr in load_case_nrs]
 
-                self.reaction_forces_dict.update(support_reaction_forces)
+        # Perform the API call
+        for node, node_nr, loadcase_id, load_case_nr in api_calls:
+            support_reaction_forces[(node, loadcase_id)] = self._create_api_call(node_nr, load_case_nr)
+        self.reaction_forces_dict = self._results_direction_conversion(support_reaction_forces)
         self._create_reaction_force_fem_object()
 
     def _create_reaction_force_fem_object(self):
@@ -3706,15 +3619,23 @@ class GetReactionForces(GetResults):
         self._create_mesh_nodes_dictionary()
         self._create_load_combination_case_dictionary()
 
-        for keys, support_reaction_forces in self.reaction_forces_dict.items():
-            load = self.load_combination_case_dict[int(support_reaction_forces['load_case_id'])]
-            node_nr = support_reaction_forces['node_nr']
-            for support in self.project.collections.supports:
-                for connecting_shapes in support.connecting_shapes:
-                    if self.mesh_node_object_dict[int(node_nr)].coordinates == connecting_shapes[
-                        'shape_geometry'].coordinates:
-                        self._get_support_results(load, support, support_reaction_forces, int(node_nr))
-                        break
+        # Collect the supports connected at the coordinates of the shape geometries, each support is added once
+        supports_at_coordinates = dict()
+        for support in self.project.collections.supports:
+            for connecting_shapes in support.connecting_shapes:
+                supports = supports_at_coordinates.setdefault(
+                    tuple(connecting_shapes['shape_geometry'].coordinates), [])
+                if not supports or supports[-1] is not support:
+                    supports.append(support)
+
+        # The IDs of the results are converted to integers once per node and load case
+        loads = {load_case_id: self.load_combination_case_dict[int(load_case_id)] for load_case_id in self.load_cases}
+        node_ids = {node_nr: int(node_nr) for node_nr, _ in self.reaction_forces_dict}
+
+        for (node_nr, load_case_id), support_reaction_forces in self.reaction_forces_dict.items():
+            node_id = node_ids[node_nr]
+            for support in supports_at_coordinates.get(tuple(self.mesh_node_object_dict[node_id].coordinates), []):
+                self._get_support_results(loads[load_case_id], support, support_reaction_forces, node_id)
 
     def _get_support_results(self, load_object: Union['LoadCase', 'LoadCombination'], support: 'Supports',
                              support_reaction_forces: dict, node_id: int):
@@ -3724,15 +3645,17 @@ class GetReactionForces(GetResults):
         Input:
             - load_object (obj): LoadCase or LoadCombination
             - support (obj): Supports
-            - support_reaction_forces (dict): reaction force dictionary
+            - support_reaction_forces (tuple): reaction forces (fx, fy, fz, mx, my, mz)
+            - node_id (int): ID of the mesh node of the support
 
         Output:
             - objects are created in project.collections.support_results
         """
-        result_dictionaries = self._create_result_dictionary(node_id, support_reaction_forces)
-        for index, result_dictionary in enumerate(result_dictionaries):
-            self.project.create_support_result(support, [[self.reaction_force_models[index], load_object, self.software,
-                                                          result_dictionary]])
+        result_dictionaries = self._create_result_dictionaries(
+            self.mesh_node_object_dict[node_id], support_reaction_forces)
+        for reaction_force_model, result_dictionary in zip(self.reaction_force_models, result_dictionaries):
+            self.project.create_support_result(
+                support, [[reaction_force_model, load_object, self.software, result_dictionary]])
 
     def _create_reaction_force_models(self):
         """
@@ -3755,73 +3678,6 @@ class GetReactionForces(GetResults):
                                       reaction_force_model_M_x, reaction_force_model_M_y,
                                       reaction_force_model_M_z]
 
-    def _create_result_dictionary(self, mesh_node_id: int, support_reaction_forces: dict) -> List:
-        """
-        Method of 'GetReactionForces' to create the results dictionary based on the "ResultsDictionary" class
-
-        Input:
-            - mesh_node_id (str): ID of mesh_node derived from reaction force dictionary
-            - reaction_forces (dict): dictionary of reaction forces
-            - mesh_node_object_dictionary(dict): dictionary with ID as key and mesh node object as value
-
-        Output:
-            - result_dictionary (list): list of Results Dictionary items
-        """
-
-        mesh_node = self.mesh_node_object_dict[mesh_node_id]
-        result_dictionary = [self.project.create_result_dictionary([mesh_node, support_reaction_forces['fx']]),
-                             self.project.create_result_dictionary([mesh_node, support_reaction_forces['fy']]),
-                             self.project.create_result_dictionary([mesh_node, support_reaction_forces['fz']]),
-                             self.project.create_result_dictionary([mesh_node, support_reaction_forces['mx']]),
-                             self.project.create_result_dictionary([mesh_node, support_reaction_forces['my']]),
-                             self.project.create_result_dictionary([mesh_node, support_reaction_forces['mz']])]
-        return result_dictionary
-
-    def _create_mesh_nodes_dictionary(self):
-        """
-        Method of 'GetReactionForces' to create a dictionary of the mesh_node objects of the project.collections and
-        the mesh_node_id
-        """
-
-        for mesh_node in self.project.collections.mesh_nodes:
-            self.mesh_node_object_dict[mesh_node.id] = mesh_node
-
-    def _create_load_combination_case_dictionary(self):
-        """
-        Method of 'GetReactionForces' to create a dictionary of the load_case and load_combination objects of the
-        project.collections and the load id
-
-        Input:
-            - No input required.
-
-        Output:
-            - load_combination_case_object_dictionary(dict) : {load_case/load_combination.id:load_object}
-        """
-
-        for load_case in self.project.collections.loadcases:
-            self.load_combination_case_dict[load_case.id] = load_case
-
-        for load_comb in self.project.collections.loadcombinations:
-            self.load_combination_case_dict[load_comb.id] = load_comb
-
-    def _reaction_forces_conversion(self, reaction_forces: list):
-        """
-        Methof of 'GetReactionForces' to convert the direction of reaction forces.
-
-        Input:
-        - a list of reaction forces which get from staad model [fx, fy, fz, mx, my, mz].
-
-        Output:
-        - a list of converted reaction forces [fx, fy, fz, mx, my, mz] following the defaut direction (Z) in FEM schema.
-        """
-
-        if self.direction['direction'] == "Z":
-            return reaction_forces
-        elif self.direction['direction'] == "Y":
-            # convert reaction forces
-            return [reaction_forces[0], -1 * reaction_forces[2], reaction_forces[1], reaction_forces[3],
-                    -1 * reaction_forces[5], reaction_forces[4]]
-
 
 class GetDisplacements(GetResults):
     """
@@ -3856,43 +3712,36 @@ class GetDisplacements(GetResults):
             - No input required.
 
         Output:
-            - self.members_displacements_list (dict): {member_id : member_id, node_nr: node_nr,
-            load_case_id: load_case_id, displacements:displacements,
-            displacement_specific:displacement_specific}
+            - self.members_displacements_dict (dict): {(member_id, node_nr, load_case_id): (dx, dy, dz, rx, ry, rz)}
         """
-        node_1 = 0
-        node_2 = 1
-        nodes = [node_1, node_2]
-
         # Join load_cases together in one dictionary
         self.load_cases = {**self.primary_loadcases, **self.load_combinations}
         members_displacements = {}
-        i = 0
 
-        # Perform the API call
-        for member_id, member_nodes in self.member_incidences.items():
-            for node in nodes:
-                for load_case_id, load_properties in self.load_cases.items():
-                    if node == 0:
-                        node_id = self.member_incidences[member_id]['start_node_ID']
-                    elif node == 1:
-                        node_id = self.member_incidences[member_id]['end_node_ID']
-                    node_displacement = self._create_api_call(int(node_id), int(load_case_id))
-                    members_displacements[i] = {'member_id': member_id,
-                                                'node_nr': node,
-                                                'load_case_id': load_case_id,
-                                                'dx': node_displacement[0],
-                                                'dy': node_displacement[1],
-                                                'dz': node_displacement[2],
-                                                'rx': node_displacement[3],
-                                                'ry': node_displacement[4],
-                                                'rz': node_displacement[5]
-                                                }
-                    i += 1
-                    self.members_displacements_dict.update(members_displacements)
+        # Collect the input for all API calls, STAAD handles the requests of OpenSTAAD one at a time
+        # The node of the member and the IDs as integers required by the API are determined once per member end and
+        # load case
+        self._create_member_node_ids_dictionary()
+        # The node of the member is the index of the node ID, 0 for the start node and 1 for the end node
+        member_node_ids = [(member_id, node, node_id)
+                           for member_id, node_ids in self.member_node_ids.items()
+                           for node, node_id in enumerate(node_ids)]
+        load_case_nrs = [(load_case_id, int(load_case_id)) for load_case_id in self.load_cases]
+        api_calls = ((member_id, node, node_id, load_case_id, load_case_nr)
+                     for member_id, node, node_id in member_node_ids for load_case_id, load_case_nr in load_case_nrs)
+
+        # Perform the API call, members connected to the same node share the displacements of that node
+        create_api_call = self._create_api_call
+        node_displacements = {}
+        for member_id, node, node_id, load_case_id, load_case_nr in api_calls:
+            displacements = node_displacements.get((node_id, load_case_nr))
+            if displacements is None:
+                displacements = node_displacements[(node_id, load_case_nr)] = create_api_call(node_id, load_case_nr)
+            members_displacements[(member_id, node, load_case_id)] = displacements
+        self.members_displacements_dict = self._results_direction_conversion(members_displacements)
         self._create_displacement_fem_object()
 
-    def _create_api_call(self, node_id: int, load_case_id: int) -> List:
+    def _create_api_call(self, node_id: int, load_case_id: int) -> tuple:
         """
         Method of 'GetDisplacements' to make the API call.
 
@@ -3901,16 +3750,11 @@ class GetDisplacements(GetResults):
             - load_case_id(int): load case ID derived from .std model objects.
 
         Output:
-            - Returns the node displacement as a list of displacements sorted on [dx, dy, dz, rx, ry, rz].
+            - Returns the node displacement as a tuple of displacements sorted on (dx, dy, dz, rx, ry, rz).
         """
-        # The output inputs need to be stored in a C++ array, these methods are used to get access to create this array
-        node_displacements_safe_array = self._make_safe_array(6)
-        node_displacements = self._make_variant_vt_ref(node_displacements_safe_array,
-                                                       comtypes.automation.VT_ARRAY | comtypes.automation.VT_R8)
-
-        # This calls a function to get displacements from STAAD
-        self.output.GetNodeDisplacements(node_id, load_case_id, node_displacements)
-        return node_displacements[0]
+        # This calls a function to get displacements from STAAD, the output is stored in the result array
+        self.output.GetNodeDisplacements(node_id, load_case_id, self._result_variant)
+        return self._result_variant[0]
 
     def _create_displacement_fem_object(self):
         """
@@ -3921,123 +3765,51 @@ class GetDisplacements(GetResults):
         self._create_load_combination_case_dictionary()
         self._create_member_dictionary()
 
-        for keys, member_displacements in self.members_displacements_dict.items():
-            member_dict = self.member_incidences[member_displacements['member_id']]
-            member = self.member_dict[int(member_displacements['member_id'])]
-            load = self.load_combination_case_dict[int(member_displacements['load_case_id'])]
-            node_nr = member_displacements['node_nr']
-            if node_nr == 0:
-                node_id = int(member_dict["start_node_ID"])
-                self._get_shape_results(load, member, member_displacements, node_id)
-            if node_nr == 1:
-                node_id = int(member_dict["end_node_ID"])
-                self._get_shape_results(load, member, member_displacements, node_id)
+        # Collect the load object per load case
+        loads = {load_case_id: self.load_combination_case_dict[int(load_case_id)] for load_case_id in self.load_cases}
+
+        # The results are grouped per member, the shape and the nodes of the member are looked up once per member
+        get_shape_results = self._get_shape_results
+        members_displacements = self.members_displacements_dict
+        for member_id, node_ids in self.member_node_ids.items():
+            member = self.member_dict[int(member_id)]
+            for node_nr, node_id in enumerate(node_ids):
+                mesh_node = self.mesh_node_object_dict[node_id]
+                for load_case_id, load_object in loads.items():
+                    get_shape_results(
+                        load_object, member, members_displacements[(member_id, node_nr, load_case_id)], mesh_node)
 
     def _get_shape_results(self, load_object: Union['LoadCase', 'LoadCombination'], member: 'Shapes',
-                           member_displacements: dict, node_id: int):
+                           member_displacements: dict, mesh_node: 'MeshNode'):
         """
         Method of 'GetDisplacements' to get shape results from 'ShapeResults' class
 
         Input:
             - load_object (obj): LoadCase or LoadCombination
             - member (obj): Shapes
-            - member_displacements (dict): displacement dictionary
+            - member_displacements (tuple): displacements (dx, dy, dz, rx, ry, rz)
+            - mesh_node (obj): MeshNode of the member end
 
         Output:
             - objects are created in project.collections.shape_results
         """
-
-        result_dictionaries = self._create_result_dictionary(node_id, member_displacements)
-        for index, result_dictionary in enumerate(result_dictionaries):
-            self.project.create_shape_result(member, [[self.displacement_models[index], load_object, self.software,
-                                                       result_dictionary]])
-
-    def _create_result_dictionary(self, mesh_node_id: int, member_displacements: dict) -> List:
-        """
-        Method of 'GetDisplacements' to create the results dictionary based on the "ResultsDictionary" class
-
-        Input:
-            - mesh_node_id (str): ID of mesh_node derived from displacement dictionary
-            - member_displacements (dict): dictionary of displacements
-            - mesh_node_object_dictionary(dict): dictionary with ID as key and mesh node object as value
-
-        Output:
-            - result_dictionary (list): list of Results Dictionary items
-        """
-
-        mesh_node = self.mesh_node_object_dict[mesh_node_id]
-        if self.direction == 'z':
-            result_dictionary = [self.project.create_result_dictionary([mesh_node, member_displacements['dx']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['dy']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['dz']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['rx']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['ry']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['rz']])]
-        else:
-            result_dictionary = [self.project.create_result_dictionary([mesh_node, member_displacements['dx']]),
-                                 self.project.create_result_dictionary([mesh_node, -member_displacements['dz']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['dy']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['rx']]),
-                                 self.project.create_result_dictionary([mesh_node, -member_displacements['rz']]),
-                                 self.project.create_result_dictionary([mesh_node, member_displacements['ry']])]
-        return result_dictionary
+        create_shape_result = self.project.create_shape_result
+        software = self.software
+        result_dictionaries = self._create_result_dictionaries(mesh_node, member_displacements)
+        for displacement_model, result_dictionary in zip(self.displacement_models, result_dictionaries):
+            create_shape_result(member, [[displacement_model, load_object, software, result_dictionary]])
 
     def _create_displacement_models(self):
         """
         Method of 'GetDisplacements' to get 'DisplacementOutputItem' object.
         """
 
-        dx = self.project.create_displacement_output_item(theoretical_formulation='translation',
-                                                          output_type='total', operation='global', component='x')
-        dy = self.project.create_displacement_output_item(theoretical_formulation='translation',
-                                                          output_type='total', operation='global', component='y')
-        dz = self.project.create_displacement_output_item(theoretical_formulation='translation',
-                                                          output_type='total', operation='global', component='z')
-        rx = self.project.create_displacement_output_item(theoretical_formulation='rotation',
-                                                          output_type='total', operation='global', component='x')
-        ry = self.project.create_displacement_output_item(theoretical_formulation='rotation',
-                                                          output_type='total', operation='global', component='y')
-        rz = self.project.create_displacement_output_item(theoretical_formulation='rotation',
-                                                          output_type='total', operation='global', component='z')
-
-        self.displacement_models = [dx, dy, dz, rx, ry, rz]
-
-    def _create_mesh_nodes_dictionary(self):
-        """
-        Method of 'GetDisplacements' to create a dictionary of the mesh_node objects of the project.collections and
-        the mesh_node_id
-        """
-
-        for mesh_node in self.project.collections.mesh_nodes:
-            self.mesh_node_object_dict[mesh_node.id] = mesh_node
-
-    def _create_load_combination_case_dictionary(self):
-        """
-        Method of 'GetDisplacements' to create a dictionary of the load_case and load_combination objects of the
-        project.collections and the load id
-
-        Input:
-            - No input required.
-
-        Output:
-            - load_combination_case_object_dictionary(dict) : {load_case/load_combination.id:load_object}
-        """
-
-        for load_case in self.project.collections.loadcases:
-            self.load_combination_case_dict[load_case.id] = load_case
-
-        for load_comb in self.project.collections.loadcombinations:
-            self.load_combination_case_dict[load_comb.id] = load_comb
-
-    def _create_member_dictionary(self):
-        """
-          Method of 'GetDisplacements' to create a dictionary of the beam/pile members objects of the
-          project.collections and the member id
-        """
-
-        for member in self.project.collections.shapes:
-            if 'Beam/Pile' in member.name:
-                self.member_dict[member.mesh.elements[0].id] = member
+        create_displacement_output_item = self.project.create_displacement_output_item
+        self.displacement_models = [
+            create_displacement_output_item(
+                theoretical_formulation=theoretical_formulation, output_type='total', operation='global',
+                component=component)
+            for theoretical_formulation, component in _RESULT_COMPONENTS]
 
 # ### ===================================================================================================================
 ###   7. End of script
@@ -33,7 +33,7 @@ from rhdhv_fem.mesh import Mesh, MeshNode, MeshElement
 from rhdhv_fem.fem_math import fem_compare_coordinates, fem_distance_coordinates, fem_divide_line, \
     fem_intersection_of_two_line_segments
 from rhdhv_fem.fem_config import Config
-from rhdhv_fem.fem_math import fem_point_on_line, fem_vector_2_points, fem_ordered_coordinates_list, fem_closest_point,\
+from rhdhv_fem.fem_math import fem_point_on_line, fem_vector_2_points, fem_ordered_coordinates_list, \
     fem_angle_between_2_vectors
 
 # Import module matplotlib, check if module is installed
@@ -64,21 +64,11 @@ def fem_duplicate_id_check(list_element):
     Output:
         - Returns the first found unique ID.
     """
+    # Collect the IDs in use once, each candidate ID is then checked with a single lookup
+    ids_in_use = {element.id for element in list_element}
     counter = 1
-    continue_check = False
-    while not continue_check:
-        if len(list_element) == 0:
-            continue_check = True
-        else:
-            check = False
-            for element in list_element:
-                if element.id == counter:
-                    check = True
-                    break
-            if not check:
-                continue_check = True
-            else:
-                counter += 1
+    while counter in ids_in_use:
+        counter += 1
     return counter
 
 
@@ -120,6 +110,34 @@ def _fem_create_meshnode(
     return meshnode
 
 
+def _fem_create_meshnodes(project: 'Project', coordinates_list: List[List[float]], check_duplicate: bool = True) \
+        -> List[MeshNode]:
+    """
+    Function to create multiple mesh-nodes in the class 'MeshNode'. The mesh-nodes are created in the same way as with
+    _fem_create_meshnode, but the IDs in use are collected once for all mesh-nodes. The next available ID is given to
+    each mesh-node, mesh-nodes that are merged with an existing mesh-node do not use an ID.
+
+    Input:
+        - project: Project object containing collections of fem objects an project variables.
+        - coordinates_list (list of list of 3 floats): The coordinates of the mesh-nodes to create.
+        - check_duplicate (bool): Select to check duplicates. Default value True.
+
+    Output:
+        - Returns the list of objects created in the 'MeshNode' class, in the order of the coordinates.
+    """
+    ids_in_use = {mesh_node.id for mesh_node in project.collections.mesh_nodes}
+    node_id = 1
+    meshnodes = []
+    for coordinates in coordinates_list:
+        while node_id in ids_in_use:
+            node_id += 1
+        meshnode = project.add(MeshNode(coordinates=coordinates, id=node_id), check_duplicate=check_duplicate)
+        if meshnode.id == node_id:
+            ids_in_use.add(node_id)
+        meshnodes.append(meshnode)
+    return meshnodes
+
+
 def _fem_create_meshelement(project: 'Project', node_list: List[MeshNode], element_id: Optional[int] = None):
     """
     Function to create an element in the class 'MeshElement'.
@@ -142,6 +160,30 @@ def _fem_create_meshelement(project: 'Project', node_list: List[MeshNode], eleme
     return project.add(MeshElement(node_list=node_list, id=element_id))
 
 
+def _fem_create_meshelements(project: 'Project', node_lists: List[List[MeshNode]]) -> List[MeshElement]:
+    """
+    Function to create multiple elements in the class 'MeshElement'. The IDs in use are collected once, each element
+    gets the next available ID.
+
+    Input:
+        - project: Project object containing collections of fem objects an project variables.
+        - node_lists (list of list of obj): Per element the list of object references of MeshNodes, which are to be
+          associated to the element.
+
+    Output:
+        - Returns the list of objects created in the 'MeshElement' class, in the order of the node lists.
+    """
+    ids_in_use = {mesh_element.id for mesh_element in project.collections.mesh_elements}
+    element_id = 1
+    elements = []
+    for node_list in node_lists:
+        while element_id in ids_in_use:
+            element_id += 1
+        elements.append(project.add(MeshElement(node_list=node_list, id=element_id)))
+        ids_in_use.add(element_id)
+    return elements
+
+
 def _fem_create_mesh(project: 'Project', elements: List[MeshElement]):
     """
     Function to create a mesh in the class 'Mesh' and add it to the project.
@@ -162,11 +204,140 @@ def _fem_create_mesh(project: 'Project', elements: List[MeshElement]):
 ### ===================================================================================================================
 
 def _fem_get_meshnode_id(project: 'Project', coordinates: List[float]):
-    nodes = list()
-    for mesh_node in project.collections.mesh_nodes:
-        if fem_compare_coordinates(mesh_node.coordinates, coordinates, precision=project.rounding_precision):
-            nodes.append(mesh_node)
-    return nodes
+    """
+    Function to get the mesh-nodes of the project on the given coordinates, using the rounding precision of the
+    project.
+
+    .. note:: The collection of mesh-nodes is scanned on every call. The collections are part of rhdhv_fem and are
+      changed outside this module, so an index on the location of the mesh-nodes can't be kept up to date between
+      calls without checking every mesh-node again.
+
+    Input:
+        - project: Project object containing collections of fem objects an project variables.
+        - coordinates (list of 3 floats): The coordinates to find the mesh-nodes for.
+
+    Output:
+        - Returns the list of mesh-nodes on the coordinates, in the order of the collection of mesh-nodes.
+    """
+    precision = project.rounding_precision
+    return [mesh_node for mesh_node in project.collections.mesh_nodes
+            if fem_compare_coordinates(mesh_node.coordinates, coordinates, precision=precision)]
+
+
+def _fem_get_connected_items(items: list, shape: 'Shape') -> list:
+    """
+    Function to get the loads or supports of which the first connecting shape is the given shape.
+
+    Input:
+        - items (list of obj): Loads or supports to check, for example project.collections.point_loads.
+        - shape (obj): Shape to which the loads or supports are connected.
+
+    Output:
+        - Returns a new list with the loads or supports connected to the shape. Loads or supports that are added to the
+          collection while looping over the returned list are not part of it.
+    """
+    return [item for item in items if item.connecting_shapes[0]['connecting_shape'] == shape]
+
+
+def _fem_get_nodes_on_edges(nodes: list, edges: List[List['Node']]) -> List[list]:
+    """
+    Function to get the nodes that are located on each of the edges of a shape, in a single pass over the nodes.
+
+    .. note:: A node is assigned to the first edge it is located on, the edges of a shape only share their corners.
+
+    Input:
+        - nodes (list of obj): Nodes to check, for example the edge nodes of a surface shape to be meshed. The corners
+          of the shape should not be part of these nodes.
+        - edges (list of lists of obj): Start and end node of each edge.
+
+    Output:
+        - Returns a list with, for each edge, a new list with the nodes on that edge, in the order of the given nodes.
+    """
+    nodes_on_edges = [[] for _ in edges]
+    for node in nodes:
+        for edge, nodes_on_edge in zip(edges, nodes_on_edges):
+            if fem_point_on_line(node, edge) is True:
+                nodes_on_edge.append(node)
+                break
+    return nodes_on_edges
+
+
+def _fem_get_closest_node(nodes: list, coordinates: List[float]) -> 'Node':
+    """
+    Function to get the node that is closest to the given coordinates.
+
+    Input:
+        - nodes (list of obj): Nodes to check, the list should not be empty.
+        - coordinates (list of float): Coordinates to which the distance is measured.
+
+    Output:
+        - Returns the node with the smallest distance to the coordinates, for equal distances the first node in the list
+          is returned.
+    """
+    return min(nodes, key=lambda node: sum(
+        (coordinate - target) ** 2 for coordinate, target in zip(node.coordinates, coordinates)))
+
+
+def _fem_quadrilateral_contour_points(
+        corner_coordinates: List[List[float]], edge_coordinates: List[List[float]], centre_coordinates: List[float]) \
+        -> List[List[List[float]]]:
+    """
+    Function to get the points of the contours of the 4 areas a quadrilateral is split into about a centre point.
+
+    Input:
+        - corner_coordinates (list of lists of float): Coordinates of the 4 corners of the quadrilateral, in the order
+          of the contour.
+        - edge_coordinates (list of lists of float): Coordinates of the 4 points on the edges of the quadrilateral, the
+          first point is on the edge from corner 1 to corner 2, the last point on the edge from corner 4 to corner 1.
+        - centre_coordinates (list of float): Coordinates of the centre point.
+
+    Output:
+        - Returns a list with the points of the contour of each of the 4 areas.
+    """
+    corner_1, corner_2, corner_3, corner_4 = corner_coordinates
+    edge_1, edge_2, edge_3, edge_4 = edge_coordinates
+    return [
+        [corner_1, edge_1, centre_coordinates, edge_4],
+        [edge_1, corner_2, edge_2, centre_coordinates],
+        [centre_coordinates, edge_2, corner_3, edge_3],
+        [edge_4, centre_coordinates, edge_3, corner_4]]
+
+
+def _fem_get_shapes_on_lines(project: 'Project', lines: List['Line']) -> list:
+    """
+    Function to get the shapes of the project that are located on the given lines. These are the shapes of which the
+    contour is one of the lines and the shapes of which the contour contains one of the lines.
+
+    Input:
+        - project: Project object containing collections of fem objects an project variables.
+        - lines (list of obj): Lines to check, for example the internal lines of a shape.
+
+    Output:
+        - Returns a list with the shapes found, per line in the order of the shapes collection. A shape is listed for
+          each line it is located on.
+    """
+    if not lines:
+        return []
+    # The type of contour is determined once per shape, not for each line
+    shape_contours = []
+    for shape_object in project.collections.shapes:
+        contour = shape_object.contour
+        shape_contours.append((
+            shape_object, contour if hasattr(contour, 'node_start') else None,
+            contour.lines if hasattr(contour, 'lines') else None))
+    shapes = []
+    for line in lines:
+        for shape_object, line_contour, contour_lines in shape_contours:
+            if line_contour is not None and line_contour == line:
+                shapes.append(shape_object)
+            elif contour_lines is not None and line in contour_lines:
+                shapes.append(shape_object)
+    return shapes
+
+
+def _fem_midpoint_coordinates(coordinates_1: List[float], coordinates_2: List[float]) -> List[float]:
+    """ Function to get the coordinates halfway between two sets of coordinates."""
+    return [(coordinate_1 + coordinate_2) / 2 for coordinate_1, coordinate_2 in zip(coordinates_1, coordinates_2)]
 
 
 def _fem_get_single_meshnode_id(project: 'Project', coordinates: List[float]):
@@ -196,8 +367,7 @@ def fem_create_regular_linemesh(line_shape: 'Lines', nr_elements: Optional[int]
     """
     project = line_shape.project
     shape_division = line_shape.get_nodes(from_start=True)
-    end_node = None
-    elements = []
+    element_node_lists = []
     for i in range(1, len(shape_division)):
 
         # Calculate the distance between the two shape nodes
@@ -209,22 +379,20 @@ def fem_create_regular_linemesh(line_shape: 'Lines', nr_elements: Optional[int]
         else:
             nr_elements_segm = nr_elements
 
-        # Calculate the increment in 3D
+        # Calculate the coordinates of the mesh-nodes along the segment, the end of the segment is used as is
         c_sta = shape_division[i - 1].coordinates
         c_end = shape_division[i].coordinates
-        c_inc = [(ce - cs) / nr_elements_segm for ce, cs in zip(c_end, c_sta)]
+        c_dif = [ce - cs for ce, cs in zip(c_end, c_sta)]
+        coordinates = [[cs + cd * j / nr_elements_segm for cs, cd in zip(c_sta, c_dif)]
+                       for j in range(nr_elements_segm)]
+        coordinates.append(list(c_end))
 
-        for j in range(nr_elements_segm):
-            if j == 0:
-                coord = [(cs + ci * j) for cs, ci in zip(c_sta, c_inc)]
-                start_node = project.create_meshnode(coord)
-            else:
-                start_node = end_node
-            coord = [(cs + ci * (j + 1)) for cs, ci in zip(c_sta, c_inc)]
-            end_node = project.create_meshnode(coord)
-            elements.append(project.create_meshelement(node_list=[start_node, end_node]))
+        # Create the mesh-nodes of the segment at once, the first is merged with the end of the previous segment
+        segment_nodes = _fem_create_meshnodes(project, coordinates)
+        element_node_lists.extend(
+            [start_node, end_node] for start_node, end_node in zip(segment_nodes, segment_nodes[1:]))
 
-    return project.create_mesh(elements=elements)
+    return project.create_mesh(elements=_fem_create_meshelements(project, element_node_lists))
 
 
 def fem_create_regular_surfacemesh(surface: 'Surfaces', nr_elements_1: Optional[int] = None,
@@ -248,26 +416,16 @@ def fem_create_regular_surfacemesh(surface: 'Surfaces', nr_elements_1: Optional[
         - Function returns the generated mesh for the surface. It does not bind it to the surface shape.
     """
     # Check the surface contour for 4 lines
-    if len(surface.contour.lines) != 4:
+    lines = surface.contour.lines
+    if len(lines) != 4:
         project = surface.project
-        meshnodes = {}
+        # The contour nodes are stored on their ID, in the order they are first found
         triangle_shape_nodes = {}
-        filtered_ids = []
-        for line in surface.contour.lines:
-            triangle_shape_nodes[f'{line.node_start.id}'] = line.node_start
-            triangle_shape_nodes[f'{line.node_end.id}'] = line.node_end
-            if line.node_start.id not in filtered_ids:
-                filtered_ids.append(line.node_start.id)
-            if line.node_end.id not in filtered_ids:
-                filtered_ids.append(line.node_end.id)
-        counter = 0
-        for i in filtered_ids:
-            meshnodes[f'mesh_node_{counter}'] = \
-                (project.create_meshnode(coordinates=triangle_shape_nodes[f'{i}'].coordinates))
-            counter += 1
-        three_sided_shape = project.create_meshelement([meshnodes['mesh_node_0'],
-                                                        meshnodes['mesh_node_1'],
-                                                        meshnodes['mesh_node_2']])
+        for line in lines:
+            triangle_shape_nodes[line.node_start.id] = line.node_start
+            triangle_shape_nodes[line.node_end.id] = line.node_end
+        meshnodes = [project.create_meshnode(coordinates=node.coordinates) for node in triangle_shape_nodes.values()]
+        three_sided_shape = project.create_meshelement(meshnodes[:3])
         return project.create_mesh(elements=[three_sided_shape])
 
     # Check the surface contour for openings, internal_lines or openings
@@ -277,32 +435,24 @@ def fem_create_regular_surfacemesh(surface: 'Surfaces', nr_elements_1: Optional[
 
     # Check if the number of elements is requested, else get from elementsize attribute of shape
     if not nr_elements_1:
-        nr_elements_1 = math.ceil(surface.contour.lines[0].get_length() / surface.elementsize)
+        nr_elements_1 = math.ceil(lines[0].get_length() / surface.elementsize)
     if not nr_elements_2:
-        nr_elements_2 = math.ceil(surface.contour.lines[1].get_length() / surface.elementsize)
+        nr_elements_2 = math.ceil(lines[1].get_length() / surface.elementsize)
     project = surface.project
 
-    # Divide the first line of the contour
-    points_n = fem_divide_line(line=surface.contour.lines[0].get_points(), nr_elements=nr_elements_1)
-
-    # List nodes_n is reversed if the end node is not connecting to the next line of contour
-    if surface.contour.lines[0].node_start in surface.contour.lines[1].get_nodes():
-        points_n.reverse()
-
-    # Divide the second line of the contour
-    points_e = fem_divide_line(line=surface.contour.lines[1].get_points(), nr_elements=nr_elements_2)
-    if not fem_compare_coordinates(points_e[0], points_n[-1]):
-        points_e.reverse()
-
-    # Divide the third line of the contour
-    points_s = fem_divide_line(line=surface.contour.lines[2].get_points(), nr_elements=nr_elements_1)
-    if not fem_compare_coordinates(points_s[0], points_e[-1]):
-        points_s.reverse()
-
-    # Divide the fourth line of the contour
-    points_w = fem_divide_line(line=surface.contour.lines[3].get_points(), nr_elements=nr_elements_2)
-    if not fem_compare_coordinates(points_w[0], points_s[-1]):
-        points_w.reverse()
+    # Divide the lines of the contour, lines 1 and 3 in the first direction and lines 2 and 4 in the second direction
+    # The points of the first line are reversed if the end node is not connecting to the next line of contour, the
+    # points of the other lines are reversed if they do not continue from the points of the previous line
+    contour_points = []
+    for line, nr_elements in zip(lines, (nr_elements_1, nr_elements_2, nr_elements_1, nr_elements_2)):
+        points = fem_divide_line(line=line.get_points(), nr_elements=nr_elements)
+        if not contour_points:
+            if line.node_start in lines[1].get_nodes():
+                points.reverse()
+        elif not fem_compare_coordinates(points[0], contour_points[-1][-1]):
+            points.reverse()
+        contour_points.append(points)
+    points_n, points_e, points_s, points_w = contour_points
 
     # The points are all arranged clockwise or anti-clockwise,
     # the order is changed to ordered in pairs
@@ -310,30 +460,35 @@ def fem_create_regular_surfacemesh(surface: 'Surfaces', nr_elements_1: Optional[
     points_w.reverse()
 
     # Initial values
-    nodes = dict()
+    intersections = list()
     elements = list()
-    counter = 0
 
-    # Create the meshnodes
-    for iy in range(nr_elements_2 + 1):
-        for ix in range(nr_elements_1 + 1):
+    # Determine the locations of the meshnodes, row by row of the grid
+    # The first and last row and column of the grid are the points on the contour, only the internal points are
+    # determined as intersections
+    last_row = len(points_w) - 1
+    for iy, (point_w, point_e) in enumerate(zip(points_w, points_e)):
+        if iy == 0 or iy == last_row:
+            intersections.extend(list(point) for point in (points_n if iy == 0 else points_s))
+            continue
+        intersections.append(list(point_w))
+        for point_n, point_s in zip(points_n[1:-1], points_s[1:-1]):
             intersection = fem_intersection_of_two_line_segments(
-                line1=[points_w[iy], points_e[iy]], line2=[points_n[ix], points_s[ix]], return_intersection=True)
-            # nodei = _line_intersection(node1, node2, node3, node4)
+                line1=[point_w, point_e], line2=[point_n, point_s], return_intersection=True)
             if intersection == 'NoIntersection' or len(intersection) == 2:
                 raise ValueError(f"ERROR: Meshing of {surface.name} ran into a problem. Meshing aborted.")
-            counter += 1
-            # Create meshnode
-            nodes[counter] = surface.project.create_meshnode(coordinates=intersection)
+            intersections.append(intersection)
+        intersections.append(list(point_e))
+
+    # Create the meshnodes, stored per row of the grid
+    meshnodes = _fem_create_meshnodes(project, intersections)
+    row_size = len(points_n)
+    rows = [meshnodes[i:i + row_size] for i in range(0, len(meshnodes), row_size)]
 
-    # Create the meshelements
-    for i in range(nr_elements_2):
+    # Create the meshelements from the nodes of two consecutive rows
+    for row, next_row in zip(rows, rows[1:]):
         for j in range(nr_elements_1):
-            elements.append(project.create_meshelement([
-                nodes[i * (nr_elements_1 + 1) + j + 1],
-                nodes[i * (nr_elements_1 + 1) + j + 2],
-                nodes[(i+1) * (nr_elements_1 + 1) + j + 2],
-                nodes[(i+1) * (nr_elements_1 + 1) + j + 1]]))
+            elements.append(project.create_meshelement([row[j], row[j + 1], next_row[j + 1], next_row[j]]))
 
     # Create and return the mesh
     return project.create_mesh(elements=elements)
@@ -345,16 +500,13 @@ def fem_plot_2_check(elements: List[MeshElement]):
         raise ImportError(
             "ERROR: To use the fem_plot_2_check function it is required to install matplotlib module.")
 
-    # Initiate the data containers for scatter plot
-    x, y, z = [], [], []
-    
-    for element in elements:
-        for node in element.node_list:
-            x.append(node.coordinates[0])
-            y.append(node.coordinates[1])
-            z.append(node.coordinates[2])
+    # Collect the coordinates of the nodes and split them in the data containers for scatter plot
+    coordinates = [node.coordinates for element in elements for node in element.node_list]
+    x, y, z = zip(*coordinates) if coordinates else ([], [], [])
 
-    matplotlib.use(Config.MPL_GUI)
+    # Switch to the interactive backend only if it is not yet active, switching closes the open figures
+    if matplotlib.get_backend().lower() != Config.MPL_GUI.lower():
+        matplotlib.use(Config.MPL_GUI)
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
     ax.scatter(x, y, z) 
@@ -406,10 +558,12 @@ def mesh_line_shape_with_internal_point(project: 'Project', member: 'Lines', nod
     # obtain list of all coordinates of internal nodes
     for node in internal_nodes_to_mesh:
         coordinates_of_internal_nodes.append(node.coordinates)
-    # Remove duplicate coordinates
+    # Remove duplicate coordinates, keeping the first occurrence
     new_order = []
+    seen_coordinates = set()
     for coord in coordinates_of_internal_nodes:
-        if coord not in new_order:
+        if tuple(coord) not in seen_coordinates:
+            seen_coordinates.add(tuple(coord))
             new_order.append(coord)
     coordinates_of_internal_nodes = new_order
     # order the internal coordinates
@@ -418,8 +572,15 @@ def mesh_line_shape_with_internal_point(project: 'Project', member: 'Lines', nod
     else:
         ordered_coordinates = []
     # now the coordinates have been ordered, obtain the node object they relate to as node objects are not
-    # iterable
+    # iterable, the nodes are looked up on their exact coordinates first
+    coordinates_to_node = {}
+    for node in internal_nodes_to_mesh:
+        coordinates_to_node.setdefault(tuple(node.coordinates), node)
     for coord in ordered_coordinates:
+        node = coordinates_to_node.get(tuple(coord))
+        if node is not None:
+            ordered_internal_nodes_to_mesh.append(node)
+            continue
         for node in internal_nodes_to_mesh:
             if fem_compare_coordinates(coord, node.coordinates, Config.CHECK_PRECISION):
                 ordered_internal_nodes_to_mesh.append(node)
@@ -433,73 +594,81 @@ def mesh_line_shape_with_internal_point(project: 'Project', member: 'Lines', nod
     beam_geometry = member.geometry
     z_axis = member.element_z_axis
     beam_material = member.material
-    temp_line_dict = {}
+    temp_lines = []
     temp_beam_dict = {}
-    temp_line_load_dict = {}
+    temp_line_loads = []
     # Create the new members along the line
     for j in range(len(ordered_internal_nodes_to_mesh) - 1):
-        temp_line_dict[f'line{j}'] = project.create_line([ordered_internal_nodes_to_mesh[j],
-                                                          ordered_internal_nodes_to_mesh[j + 1]])
-        temp_beam_dict[f'beam{j}'] = project.create_beam(shape_line=temp_line_dict[f'line{j}'],
-                                                         name=f'{name}_meshed_{j}',
-                                                         material=beam_material,
-                                                         geometry=beam_geometry)
-        temp_beam_dict[f'beam{j}'].mesh_shape(1)
-        temp_beam_dict[f'beam{j}'].update_local_z_axis(z_axis.vector)
+        temp_lines.append(project.create_line([ordered_internal_nodes_to_mesh[j],
+                                               ordered_internal_nodes_to_mesh[j + 1]]))
+        beam = project.create_beam(shape_line=temp_lines[j],
+                                   name=f'{name}_meshed_{j}',
+                                   material=beam_material,
+                                   geometry=beam_geometry)
+        beam.mesh_shape(1)
+        beam.update_local_z_axis(z_axis.vector)
+        temp_beam_dict[f'beam{j}'] = beam
+    # Member per location of the end nodes of the new members, used to find the member a point load or point support
+    # is located on. Nodes compare on their location, so the coordinates are rounded to the precision of the project.
+    # The members are added in order, so for a node shared by two members the last member is used
+    precision = project.rounding_precision
+    end_node_to_beam = {}
+    for beam in temp_beam_dict.values():
+        for end_node in (beam.contour.node_start, beam.contour.node_end):
+            end_node_to_beam[tuple(round(coordinate, precision) for coordinate in end_node.coordinates)] = beam
+
+    def get_new_member_at_node(node):
+        """
+        Returns the last new member with an end node on the location of the given node. Returns None if the node is
+        not on an end node of the new members
+        """
+        return end_node_to_beam.get(tuple(round(coordinate, precision) for coordinate in node.coordinates))
 
     loads_to_delete = []
     # determine if any point loads are associated with the original member and replace connecting shape with new
     # member that has been created that shares the node
-    for load in project.collections.point_loads:
-        if load.connecting_shapes[0]['connecting_shape'] == member:
-            for key in temp_beam_dict:
-                if temp_beam_dict[key].contour.node_start == load.connecting_shapes[0]['shape_geometry'] or \
-                        temp_beam_dict[key].contour.node_end == load.connecting_shapes[0]['shape_geometry']:
-                    load.connecting_shapes[0]['connecting_shape'] = temp_beam_dict[key]
-    line_load_counter = 0
+    for load in _fem_get_connected_items(project.collections.point_loads, member):
+        connecting_shape = load.connecting_shapes[0]
+        beam = get_new_member_at_node(connecting_shape['shape_geometry'])
+        if beam is not None:
+            connecting_shape['connecting_shape'] = beam
     # determine if any line loads are associated with the original member and assign these loads to the new members
-    for load in project.collections.line_loads:
-        if load.connecting_shapes[0]['connecting_shape'] == member:
-            # Get load attributes
-            line_load_direction = load.direction
-            line_load_value = load.value
-            line_load_type = load.load_type
-            line_load_case = load.loadcase
-            loads_to_delete.append(load)
-            # create new line loads across new members
-            for value in temp_beam_dict:
-                temp_line_load_dict[f'line_load_{line_load_counter}'] = project.create_lineload(
-                    load_type=line_load_type,
-                    value=line_load_value,
-                    direction=line_load_direction,
-                    loadcase=line_load_case,
-                    connecting_shapes=[{"connecting_shape": temp_beam_dict[value]}])
-                line_load_counter += 1
-    line_support_dict = {}
-    line_support_counter = 0
+    for load in _fem_get_connected_items(project.collections.line_loads, member):
+        # Get load attributes
+        line_load_direction = load.direction
+        line_load_value = load.value
+        line_load_type = load.load_type
+        line_load_case = load.loadcase
+        loads_to_delete.append(load)
+        # create new line loads across new members
+        for beam in temp_beam_dict.values():
+            temp_line_loads.append(project.create_lineload(
+                load_type=line_load_type,
+                value=line_load_value,
+                direction=line_load_direction,
+                loadcase=line_load_case,
+                connecting_shapes=[{"connecting_shape": beam}]))
+    line_supports = []
     # adjust point supports to make sure connected shape matches new member created
-    for support in project.collections.point_supports:
-        if support.connecting_shapes[0]['connecting_shape'] == member:
-            for key in temp_beam_dict:
-                if temp_beam_dict[key].contour.node_start == support.connecting_shapes[0]['shape_geometry'] or \
-                   temp_beam_dict[key].contour.node_end == support.connecting_shapes[0]['shape_geometry']:
-                    support.connecting_shapes[0]['connecting_shape'] = temp_beam_dict[key]
+    for support in _fem_get_connected_items(project.collections.point_supports, member):
+        connecting_shape = support.connecting_shapes[0]
+        beam = get_new_member_at_node(connecting_shape['shape_geometry'])
+        if beam is not None:
+            connecting_shape['connecting_shape'] = beam
     # check if any line supports associated with original member and assign/create if so for all new members
-    for support in project.collections.line_supports:
-        if support.connecting_shapes[0]['connecting_shape'] == member:
-            if member.contour == support.connecting_shapes[0]['shape_geometry']:
-                degrees_of_freedom = support.degrees_of_freedom
-                axes = support.axes
-                spring_stiffnesses = support.spring_stiffnesses
-                support_set = support.support_set
-                for key in temp_beam_dict:
-                    line_support_dict[f'line_support{line_support_counter}'] = project.create_linesupport(
-                        connecting_shapes=[{'connecting_shape': temp_beam_dict[key]}],
-                        degrees_of_freedom=degrees_of_freedom,
-                        support_set=support_set,
-                        axes=axes,
-                        spring_stiffnesses=spring_stiffnesses)
-                    line_support_counter += 1
+    for support in _fem_get_connected_items(project.collections.line_supports, member):
+        if member.contour == support.connecting_shapes[0]['shape_geometry']:
+            degrees_of_freedom = support.degrees_of_freedom
+            axes = support.axes
+            spring_stiffnesses = support.spring_stiffnesses
+            support_set = support.support_set
+            for beam in temp_beam_dict.values():
+                line_supports.append(project.create_linesupport(
+                    connecting_shapes=[{'connecting_shape': beam}],
+                    degrees_of_freedom=degrees_of_freedom,
+                    support_set=support_set,
+                    axes=axes,
+                    spring_stiffnesses=spring_stiffnesses))
     return [temp_beam_dict, loads_to_delete]
 
 
@@ -560,6 +729,19 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
     # obtain object properties
     material = shape.material
     geometry = shape.geometry
+
+    def create_meshed_surfaces(contours):
+        """
+        Creates a surface shape with the material and geometry of the original shape for each of the contours, each
+        meshed as a single element. Returns the list of new surface shapes
+        """
+        surfaces = []
+        for contour in contours:
+            surface = project.create_surface(shape_polyline=contour, material=material, geometry=geometry)
+            surface.mesh_shape(1, 1)
+            surfaces.append(surface)
+        return surfaces
+
     # Check if any point lies on the contour
     edge_nodes_to_mesh = []
     internal_nodes_to_mesh = []
@@ -577,92 +759,64 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
         for in the mesh (edge_nodes_to_mesh), Number of corners to identify what type of shape it is (no_of_corners)
         """
         # Gather the contour nodes, including those that are internal points between corners
+        # The node of each line that is not shared with the next line is added, the last line is followed by the first
+        # Checking membership of the pair compares on identity first, only different node objects are compared on value
         contour_nodes = []
-        for j in range(len(shape.contour.lines)):
-            if j != len(shape.contour.lines) - 1:
-                if shape.contour.lines[j].node_start == shape.contour.lines[j + 1].node_start or \
-                        shape.contour.lines[j].node_start == shape.contour.lines[j + 1].node_end:
-                    contour_nodes.append(shape.contour.lines[j].node_end)
-                else:
-                    contour_nodes.append(shape.contour.lines[j].node_start)
+        lines = shape.contour.lines
+        for line, next_line in zip(lines, lines[1:] + lines[:1]):
+            node_start = line.node_start
+            if node_start in (next_line.node_start, next_line.node_end):
+                contour_nodes.append(line.node_end)
             else:
-                if shape.contour.lines[j].node_start == shape.contour.lines[0].node_start or \
-                        shape.contour.lines[j].node_start == shape.contour.lines[0].node_end:
-                    contour_nodes.append(shape.contour.lines[j].node_end)
-                else:
-                    contour_nodes.append(shape.contour.lines[j].node_start)
+                contour_nodes.append(node_start)
+        # Determine for each contour node if it is a corner, by checking if the node is on the same line as the
+        # previous node and the next one in the order (the contour is closed, the first and last node are adjacent)
+        nr_contour_nodes = len(contour_nodes)
+        is_corner = [
+            fem_point_on_line(node, [contour_nodes[k - 1], contour_nodes[(k + 1) % nr_contour_nodes]]) is False
+            for k, node in enumerate(contour_nodes)]
         # Identify the number of corners to identify if its a triangle or quadrilateral
-        no_of_corners = 0
-        for k in range(len(contour_nodes)):
-            if k == 0:
-                if fem_point_on_line(contour_nodes[k],
-                                     [contour_nodes[(len(contour_nodes) - 1)], contour_nodes[k + 1]]) is False:
-                    no_of_corners += 1
-            elif k == (len(contour_nodes) - 1):
-                if fem_point_on_line(contour_nodes[k],
-                                     [contour_nodes[k - 1], contour_nodes[0]]) is False:
-                    no_of_corners += 1
-            else:
-                if fem_point_on_line(contour_nodes[k],
-                                     [contour_nodes[k - 1], contour_nodes[k + 1]]) is False:
-                    no_of_corners += 1
-        corners = {}
+        no_of_corners = sum(is_corner)
+        # A triangle or quadrilateral without nodes along its edges has only corners in its contour, these are the
+        # corners in their original order and there are no edge nodes to mesh
+        if no_of_corners == nr_contour_nodes and no_of_corners in (3, 4):
+            return contour_nodes, list(contour_nodes), edge_nodes_to_mesh, no_of_corners
+        corners = []
         # Identify the corners, maintaining the original order of the original plate to maintain orientation
         # corner 1 is the first node
-        corners['corner_1'] = contour_nodes[0]
-        corner_counter = 2
+        corners.append(contour_nodes[0])
         # Using the exercise above, you now know whether its a triangle or quadrilateral and therefore can find
         # the corners and number them
+        # The first node is skipped as it is corner 1, the last nodes of the contour are the last corners if these are
+        # not found yet
+        last = nr_contour_nodes - 1
+        # Each node that is not a corner is a node along the edge that needs to be included in the mesh
         if no_of_corners == 3:
             # loop through contour nodes determining when there is a corner by checking if the node is on the
             # same line as the previous node and the next one in the order
-            for j in range(len(contour_nodes)):
-                if j == 0:
-                    continue
-                elif j == len(contour_nodes) - 2:
-                    if 'corner_2' not in corners:
-                        corners[f'corner_{corner_counter}'] = contour_nodes[j]
-                        corner_counter += 1
-                        continue
-                elif j == len(contour_nodes) - 1:
-                    if 'corner_3' not in corners:
-                        corners[f'corner_{corner_counter}'] = contour_nodes[j]
-                        corner_counter += 1
-                        continue
-                if j != len(contour_nodes) - 1:
-                    if fem_point_on_line(contour_nodes[j], [contour_nodes[j - 1], contour_nodes[j + 1]]) is False:
-                        corners[f'corner_{corner_counter}'] = contour_nodes[j]
-                        corner_counter += 1
+            for j, node in enumerate(contour_nodes[1:], start=1):
+                if j == last - 1 and len(corners) < 2:
+                    corners.append(node)
+                elif j == last and len(corners) < 3:
+                    corners.append(node)
+                elif j != last and is_corner[j]:
+                    corners.append(node)
+                else:
+                    edge_nodes_to_mesh.append(node)
         else:
             # loop through contour nodes determining when there is a corner by checking if the node is on the
             # same line as the previous node and the next one in the order
-            for j in range(len(contour_nodes)):
-                if j == 0:
-                    continue
-                elif j == len(contour_nodes) - 3:
-                    if 'corner_2' not in corners:
-                        corners[f'corner_{corner_counter}'] = contour_nodes[j]
-                        corner_counter += 1
-                        continue
-                elif j == len(contour_nodes) - 2:
-                    if 'corner_3' not in corners:
-                        corners[f'corner_{corner_counter}'] = contour_nodes[j]
-                        corner_counter += 1
-                        continue
-                elif j == len(contour_nodes) - 1:
-                    if 'corner_4' not in corners:
-                        corners[f'corner_{corner_counter}'] = contour_nodes[j]
-                        corner_counter += 1
-                        continue
-                if j != len(contour_nodes) - 1:
-                    if fem_point_on_line(contour_nodes[j], [contour_nodes[j - 1], contour_nodes[j + 1]]) is False:
-                        corners[f'corner_{corner_counter}'] = contour_nodes[j]
-                        corner_counter += 1
-        # for each node in the contour nodes. if it is not a corner node it is therefore a node that needs to
-        # be included in the mesh. This can be identified by checking the corners we just found
-        for j in contour_nodes:
-            if j not in corners.values():
-                edge_nodes_to_mesh.append(j)
+            for j, node in enumerate(contour_nodes[1:], start=1):
+                if j == last - 2 and len(corners) < 2:
+                    corners.append(node)
+                elif j == last - 1 and len(corners) < 3:
+                    corners.append(node)
+                elif j == last and len(corners) < 4:
+                    corners.append(node)
+                elif j != last and is_corner[j]:
+                    corners.append(node)
+                else:
+                    edge_nodes_to_mesh.append(node)
         return contour_nodes, corners, edge_nodes_to_mesh, no_of_corners
 
     contour_nodes, corners, edge_nodes_to_mesh, no_of_corners = determine_nodes_along_edge_of_shape_to_be_meshed(shape)
@@ -683,83 +837,53 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
             """
             # If there are multiple internal nodes, find the closest one to the centre
             if len(internal_nodes_to_mesh) > 1:
-                temp_dict_to_measure_distance = {}
-                for internal_node in internal_nodes_to_mesh:
-                    temp_dict_to_measure_distance[f'{internal_node.id}'] = internal_node.coordinates
-                closest, index = fem_closest_point(shape.contour.get_centroid(),
-                                                   list(temp_dict_to_measure_distance.values()))
-                id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                    list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                for internal_node in internal_nodes_to_mesh:
-                    if internal_node.id == int(id_of_centre_node):
-                        centre_node = internal_node
-                        break
+                centre_node = _fem_get_closest_node(internal_nodes_to_mesh, shape.contour.get_centroid())
             else:
                 # if only one internal node, use that
                 centre_node = internal_nodes_to_mesh[0]
             # If the shape is a triangle, you can then split this into three triangles about the centre node
-            temp_contour_dict = {}
+            temp_contours = []
             if no_of_corners == 3:
                 # Create contours for the 3 new areas created from the original panel
-                temp_contour_dict[f'c1'] = project.create_polyline([corners['corner_1'].coordinates,
-                                                                    corners['corner_2'].coordinates,
-                                                                    centre_node.coordinates])
-                temp_contour_dict[f'c2'] = project.create_polyline([centre_node.coordinates,
-                                                                    corners['corner_2'].coordinates,
-                                                                    corners['corner_3'].coordinates])
-                temp_contour_dict[f'c3'] = project.create_polyline([centre_node.coordinates,
-                                                                    corners['corner_3'].coordinates,
-                                                                    corners['corner_1'].coordinates])
+                temp_contours.append(project.create_polyline([corners[0].coordinates,
+                                                              corners[1].coordinates,
+                                                              centre_node.coordinates]))
+                temp_contours.append(project.create_polyline([centre_node.coordinates,
+                                                              corners[1].coordinates,
+                                                              corners[2].coordinates]))
+                temp_contours.append(project.create_polyline([centre_node.coordinates,
+                                                              corners[2].coordinates,
+                                                              corners[0].coordinates]))
             # If the shape is a quadrilateral and you have chosen to accept triangle mesh, split the shape into
             # four different triangles about the internal node
             elif no_of_corners == 4 and triangle_mesh_allowed is True:
                 # Create contours for the 4 new areas created from the original panel
-                temp_contour_dict[f'c1'] = project.create_polyline([corners['corner_1'].coordinates,
-                                                                    corners['corner_2'].coordinates,
-                                                                    centre_node.coordinates])
-                temp_contour_dict[f'c2'] = project.create_polyline([centre_node.coordinates,
-                                                                    corners['corner_2'].coordinates,
-                                                                    corners['corner_3'].coordinates])
-                temp_contour_dict[f'c3'] = project.create_polyline([centre_node.coordinates,
-                                                                    corners['corner_3'].coordinates,
-                                                                    corners['corner_4'].coordinates])
-                temp_contour_dict[f'c4'] = project.create_polyline([corners['corner_1'].coordinates,
-                                                                    centre_node.coordinates,
-                                                                    corners['corner_4'].coordinates])
+                temp_contours.append(project.create_polyline([corners[0].coordinates,
+                                                              corners[1].coordinates,
+                                                              centre_node.coordinates]))
+                temp_contours.append(project.create_polyline([centre_node.coordinates,
+                                                              corners[1].coordinates,
+                                                              corners[2].coordinates]))
+                temp_contours.append(project.create_polyline([centre_node.coordinates,
+                                                              corners[2].coordinates,
+                                                              corners[3].coordinates]))
+                temp_contours.append(project.create_polyline([corners[0].coordinates,
+                                                              centre_node.coordinates,
+                                                              corners[3].coordinates]))
             # Else, if shape is a quadrilateral and chosen not to use triangles, split into four squares about
             # the internal point
             else:
-                # As splitting into four squares, need intermediate nodes between each corner
-                edge_node_1 = project.create_node(coordinates=[(corners['corner_1'].coordinates[0] +
-                                                                corners['corner_2'].coordinates[0]) / 2,
-                                                               (corners['corner_1'].coordinates[1] +
-                                                                corners['corner_2'].coordinates[1]) / 2,
-                                                               (corners['corner_1'].coordinates[2] +
-                                                                corners['corner_2'].coordinates[2]) / 2])
-                edge_node_2 = project.create_node(coordinates=[(corners['corner_2'].coordinates[0] +
-                                                                corners['corner_3'].coordinates[0]) / 2,
-                                                               (corners['corner_2'].coordinates[1] +
-                                                                corners['corner_3'].coordinates[1]) / 2,
-                                                               (corners['corner_2'].coordinates[2] +
-                                                                corners['corner_3'].coordinates[2]) / 2])
-                edge_node_3 = project.create_node(coordinates=[(corners['corner_3'].coordinates[0] +
-                                                                corners['corner_4'].coordinates[0]) / 2,
-                                                               (corners['corner_3'].coordinates[1] +
-                                                                corners['corner_4'].coordinates[1]) / 2,
-                                                               (corners['corner_3'].coordinates[2] +
-                                                                corners['corner_4'].coordinates[2]) / 2])
-                edge_node_4 = project.create_node(coordinates=[(corners['corner_4'].coordinates[0] +
-                                                                corners['corner_1'].coordinates[0]) / 2,
-                                                               (corners['corner_4'].coordinates[1] +
-                                                                corners['corner_1'].coordinates[1]) / 2,
-                                                               (corners['corner_4'].coordinates[2] +
-                                                                corners['corner_1'].coordinates[2]) / 2])
+                # As splitting into four squares, need intermediate nodes between each corner, the last corner is
+                # followed by the first, these nodes along the edge which are now new are created as a list
+                corner_coordinates = [corner.coordinates for corner in corners[:4]]
+                edge_nodes = [
+                    project.create_node(coordinates=_fem_midpoint_coordinates(coordinates_1, coordinates_2))
+                    for coordinates_1, coordinates_2 in zip(
+                        corner_coordinates, corner_coordinates[1:] + corner_coordinates[:1])]
                 # To maintain the direction of members, determine if any members along the edges of the plate
                 # must be split before creating new plates
                 # get any connecting shapes to the current plate
                 connecting_elements = shape.get_connecting_shapes()
-                # nodes along the edge which are now new are to be created as a list
-                edge_nodes = [edge_node_1, edge_node_2, edge_node_3, edge_node_4]
                 for element in connecting_elements:
                     # if an element is a beam/column
                     if hasattr(element.contour, 'node_start'):
@@ -777,46 +901,17 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                             # check for new found connectivity and to ensure mesh is suitable
                             shapes_to_check_connections.extend(element.get_connecting_shapes())
                             if element.internal_lines is not None:
-                                for internal_line in element.internal_lines:
-                                    for shape_object in project.collections.shapes:
-                                        if hasattr(shape_object.contour,
-                                                   'node_start') and shape_object.contour == internal_line:
-                                            shapes_to_check_connections.append(shape_object)
-                                        elif hasattr(shape_object.contour,
-                                                     'lines') and internal_line in shape_object.contour.lines:
-                                            shapes_to_check_connections.append(shape_object)
+                                shapes_to_check_connections.extend(
+                                    _fem_get_shapes_on_lines(project, element.internal_lines))
                             for value in temp_beam_dict:
                                 shapes_to_check_connections.append(temp_beam_dict[value])
                 # Create contours for the 4 new areas created from the original panel
-                temp_contour_dict[f'c1'] = project.create_polyline([corners['corner_1'].coordinates,
-                                                                    edge_node_1.coordinates,
-                                                                    centre_node.coordinates,
-                                                                    edge_node_4.coordinates])
-                temp_contour_dict[f'c2'] = project.create_polyline([edge_node_1.coordinates,
-                                                                    corners['corner_2'].coordinates,
-                                                                    edge_node_2.coordinates,
-                                                                    centre_node.coordinates])
-                temp_contour_dict[f'c3'] = project.create_polyline([centre_node.coordinates,
-                                                                    edge_node_2.coordinates,
-                                                                    corners['corner_3'].coordinates,
-                                                                    edge_node_3.coordinates])
-                temp_contour_dict[f'c4'] = project.create_polyline([edge_node_4.coordinates,
-                                                                    centre_node.coordinates,
-                                                                    edge_node_3.coordinates,
-                                                                    corners['corner_4'].coordinates])
+                temp_contours.extend(project.create_polyline(points) for points in _fem_quadrilateral_contour_points(
+                    corner_coordinates, [edge_node.coordinates for edge_node in edge_nodes], centre_node.coordinates))
             # generate 4 new panels for the project
-            temp_surface_dict = {}
-            l = 0
-            for key in temp_contour_dict:
-                value = temp_contour_dict[key]
-                temp_surface_dict[f'plate{l}'] = project.create_surface(shape_polyline=value,
-                                                                        material=material,
-                                                                        geometry=geometry)
-                temp_surface_dict[f'plate{l}'].mesh_shape(1, 1)
-                l += 1
-            return temp_surface_dict
-
-        temp_surface_dict = mesh_shape_with_only_internal_nodes(internal_nodes_to_mesh)
+            return create_meshed_surfaces(temp_contours)
+
+        temp_surfaces = mesh_shape_with_only_internal_nodes(internal_nodes_to_mesh)
     # Else is for when edge nodes are needed to be taken into account if there are any present
     else:
         # shape in question now is to be meshed and therefore will need to be removed from the project
@@ -832,17 +927,7 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
             # If there are internal nodes - if only one, use first one of these. If more than 1, use closest to
             # centroid of shape
             if len(internal_nodes_to_mesh) > 1:
-                temp_dict_to_measure_distance = {}
-                for internal_node in internal_nodes_to_mesh:
-                    temp_dict_to_measure_distance[f'{internal_node.id}'] = internal_node.coordinates
-                closest, index = fem_closest_point(shape.contour.get_centroid(),
-                                                   list(temp_dict_to_measure_distance.values()))
-                id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                    list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                for internal_node in internal_nodes_to_mesh:
-                    if internal_node.id == int(id_of_centre_node):
-                        centre_node = internal_node
-                        break
+                centre_node = _fem_get_closest_node(internal_nodes_to_mesh, shape.contour.get_centroid())
             elif len(internal_nodes_to_mesh) == 1:
                 centre_node = internal_nodes_to_mesh[0]
             # # otherwise create new node at the centre of the project
@@ -857,74 +942,28 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                 edge_node_1 = None
                 edge_node_2 = None
                 edge_node_3 = None
-                edge_nodes_along_edge1 = []
-                edge_nodes_along_edge2 = []
-                edge_nodes_along_edge3 = []
                 edges_nodes_triangle = []
                 # Determine what corner the nodes in edge nodes to mesh sit between to be the intermediate node
+                edge_nodes_along_edge1, edge_nodes_along_edge2, edge_nodes_along_edge3 = _fem_get_nodes_on_edges(
+                    edge_nodes_to_mesh, [[corners[0], corners[1]], [corners[1], corners[2]], [corners[2], corners[0]]])
                 # Determine the node which is closest to the centre of the edge in question
                 # Edge node 1 calc
-                for j in edge_nodes_to_mesh:
-                    if fem_point_on_line(j, [corners['corner_1'], corners['corner_2']]) is True:
-                        edge_nodes_along_edge1.append(j)
                 if len(edge_nodes_along_edge1) > 0:
-                    temp_dict_to_measure_distance = {}
-                    for edge_node in edge_nodes_along_edge1:
-                        temp_dict_to_measure_distance[f'{edge_node.id}'] = edge_node.coordinates
-                    centre = [(corners['corner_1'][0] + corners['corner_2'][0]) / 2,
-                              (corners['corner_1'][1] + corners['corner_2'][1]) / 2,
-                              (corners['corner_1'][2] + corners['corner_2'][2]) / 2]
-                    closest, index = fem_closest_point(centre,
-                                                       list(temp_dict_to_measure_distance.values()))
-                    id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                        list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                    for edge_node in edge_nodes_along_edge1:
-                        if edge_node.id == int(id_of_centre_node):
-                            edge_node_1 = edge_node
-                            edges_nodes_triangle.append(edge_node_1)
-                            break
+                    centre = _fem_midpoint_coordinates(corners[0].coordinates, corners[1].coordinates)
+                    edge_node_1 = _fem_get_closest_node(edge_nodes_along_edge1, centre)
+                    edges_nodes_triangle.append(edge_node_1)
                 # Repeat and find most central edge node
                 # Edge node 2 calc
-                for j in edge_nodes_to_mesh:
-                    if fem_point_on_line(j, [corners['corner_2'], corners['corner_3']]) is True:
-                        edge_nodes_along_edge2.append(j)
                 if len(edge_nodes_along_edge2) > 0:
-                    temp_dict_to_measure_distance = {}
-                    for edge_node in edge_nodes_along_edge2:
-                        temp_dict_to_measure_distance[f'{edge_node.id}'] = edge_node.coordinates
-                    centre = [(corners['corner_2'][0] + corners['corner_3'][0]) / 2,
-                              (corners['corner_2'][1] + corners['corner_3'][1]) / 2,
-                              (corners['corner_2'][2] + corners['corner_3'][2]) / 2]
-                    closest, index = fem_closest_point(centre,
-                                                       list(temp_dict_to_measure_distance.values()))
-                    id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                        list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                    for edge_node in edge_nodes_along_edge2:
-                        if edge_node.id == int(id_of_centre_node):
-                            edge_node_2 = edge_node
-                            edges_nodes_triangle.append(edge_node_2)
-                            break
+                    centre = _fem_midpoint_coordinates(corners[1].coordinates, corners[2].coordinates)
+                    edge_node_2 = _fem_get_closest_node(edge_nodes_along_edge2, centre)
+                    edges_nodes_triangle.append(edge_node_2)
                 # Repeat and find most central edge node
                 # Edge node 3 calc
-                for j in edge_nodes_to_mesh:
-                    if fem_point_on_line(j, [corners['corner_3'], corners['corner_1']]) is True:
-                        edge_nodes_along_edge3.append(j)
                 if len(edge_nodes_along_edge3) > 0:
-                    temp_dict_to_measure_distance = {}
-                    for edge_node in edge_nodes_along_edge3:
-                        temp_dict_to_measure_distance[f'{edge_node.id}'] = edge_node.coordinates
-                    centre = [(corners['corner_3'][0] + corners['corner_1'][0]) / 2,
-                              (corners['corner_3'][1] + corners['corner_1'][1]) / 2,
-                              (corners['corner_3'][2] + corners['corner_1'][2]) / 2]
-                    closest, index = fem_closest_point(centre,
-                                                       list(temp_dict_to_measure_distance.values()))
-                    id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                        list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                    for edge_node in edge_nodes_along_edge3:
-                        if edge_node.id == int(id_of_centre_node):
-                            edge_node_3 = edge_node
-                            edges_nodes_triangle.append(edge_node_3)
-                            break
+                    centre = _fem_midpoint_coordinates(corners[2].coordinates, corners[0].coordinates)
+                    edge_node_3 = _fem_get_closest_node(edge_nodes_along_edge3, centre)
+                    edges_nodes_triangle.append(edge_node_3)
                 # To maintain the direction of members, determine if any members along the edges of the plate
                 # must be split before creating new plates
                 # get any connecting shapes to the current plate
@@ -947,63 +986,27 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                             # check for new found connectivity and to ensure mesh is suitable
                             shapes_to_check_connections.extend(element.get_connecting_shapes())
                             if element.internal_lines is not None:
-                                for internal_line in element.internal_lines:
-                                    for shape_object in project.collections.shapes:
-                                        if hasattr(shape_object.contour,
-                                                   'node_start') and shape_object.contour == internal_line:
-                                            shapes_to_check_connections.append(shape_object)
-                                        elif hasattr(shape_object.contour,
-                                                     'lines') and internal_line in shape_object.contour.lines:
-                                            shapes_to_check_connections.append(shape_object)
+                                shapes_to_check_connections.extend(
+                                    _fem_get_shapes_on_lines(project, element.internal_lines))
                             for value in temp_beam_dict:
                                 shapes_to_check_connections.append(temp_beam_dict[value])
                 # Create contours for the new areas created from the original panel. This is about the centre of
                 # the triangle. Therefore creating, up to 6 new triangles, depending on if there is edge nodes
-                temp_contour_dict = {}
-                if edge_node_1 is None:
-                    temp_contour_dict[f'c1'] = project.create_polyline([corners['corner_1'].coordinates,
-                                                                        corners['corner_2'].coordinates,
-                                                                        centre_node.coordinates])
-                else:
-                    temp_contour_dict[f'c1'] = project.create_polyline([corners['corner_1'].coordinates,
-                                                                        edge_node_1.coordinates,
-                                                                        centre_node.coordinates])
-                    temp_contour_dict[f'c2'] = project.create_polyline([edge_node_1.coordinates,
-                                                                        corners['corner_2'].coordinates,
-                                                                        centre_node.coordinates])
-                if edge_node_2 is None:
-                    temp_contour_dict[f'c3'] = project.create_polyline([corners['corner_2'].coordinates,
-                                                                        corners['corner_3'].coordinates,
-                                                                        centre_node.coordinates])
-                else:
-                    temp_contour_dict[f'c3'] = project.create_polyline([corners['corner_2'].coordinates,
-                                                                        edge_node_2.coordinates,
-                                                                        centre_node.coordinates])
-                    temp_contour_dict[f'c4'] = project.create_polyline([edge_node_2.coordinates,
-                                                                        corners['corner_3'].coordinates,
-                                                                        centre_node.coordinates])
-                if edge_node_3 is None:
-                    temp_contour_dict[f'c5'] = project.create_polyline([corners['corner_3'].coordinates,
-                                                                        corners['corner_1'].coordinates,
-                                                                        centre_node.coordinates])
-                else:
-                    temp_contour_dict[f'c5'] = project.create_polyline([corners['corner_3'].coordinates,
-                                                                        edge_node_3.coordinates,
-                                                                        centre_node.coordinates])
-                    temp_contour_dict[f'c6'] = project.create_polyline([edge_node_3.coordinates,
-                                                                        corners['corner_1'].coordinates,
-                                                                        centre_node.coordinates])
+                temp_contours = []
+                corner_coordinates = [corner.coordinates for corner in corners[:3]]
+                centre_coordinates = centre_node.coordinates
+                # Each edge runs from a corner to the next corner, the last corner is followed by the first
+                for corner_a, edge_node, corner_b in zip(
+                        corner_coordinates, [edge_node_1, edge_node_2, edge_node_3],
+                        corner_coordinates[1:] + corner_coordinates[:1]):
+                    if edge_node is None:
+                        temp_contours.append(project.create_polyline([corner_a, corner_b, centre_coordinates]))
+                    else:
+                        edge_coordinates = edge_node.coordinates
+                        temp_contours.append(project.create_polyline([corner_a, edge_coordinates, centre_coordinates]))
+                        temp_contours.append(project.create_polyline([edge_coordinates, corner_b, centre_coordinates]))
                 # generate new panels for the project
-                temp_surface_dict = {}
-                l = 0
-                for key in temp_contour_dict:
-                    value = temp_contour_dict[key]
-                    temp_surface_dict[f'plate{l}'] = project.create_surface(shape_polyline=value,
-                                                                            material=material,
-                                                                            geometry=geometry)
-                    temp_surface_dict[f'plate{l}'].mesh_shape(1, 1)
-                    l += 1
-                return temp_surface_dict
+                return create_meshed_surfaces(temp_contours)
 
             def mesh_quadrilateral_shape_with_nodes_along_edge():
                 """
@@ -1016,26 +1019,10 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                 edge_node_3 = None
                 edge_node_4 = None
                 # Determine what corner the nodes in edge nodes to mesh sit between to be the intermediate node
-                edge_nodes_along_edge1 = []
-                edge_nodes_along_edge2 = []
-                edge_nodes_along_edge3 = []
-                edge_nodes_along_edge4 = []
-                # Edge node 1 calc
-                for j in edge_nodes_to_mesh:
-                    if fem_point_on_line(j, [corners['corner_1'], corners['corner_2']]) is True:
-                        edge_nodes_along_edge1.append(j)
-                # Edge node 2 calc
-                for j in edge_nodes_to_mesh:
-                    if fem_point_on_line(j, [corners['corner_2'], corners['corner_3']]) is True:
-                        edge_nodes_along_edge2.append(j)
-                # Edge node 3 calc
-                for j in edge_nodes_to_mesh:
-                    if fem_point_on_line(j, [corners['corner_3'], corners['corner_4']]) is True:
-                        edge_nodes_along_edge3.append(j)
-                # Edge node 4 calc
-                for j in edge_nodes_to_mesh:
-                    if fem_point_on_line(j, [corners['corner_1'], corners['corner_4']]) is True:
-                        edge_nodes_along_edge4.append(j)
+                edge_nodes_along_edge1, edge_nodes_along_edge2, edge_nodes_along_edge3, edge_nodes_along_edge4 = \
+                    _fem_get_nodes_on_edges(edge_nodes_to_mesh, [
+                        [corners[0], corners[1]], [corners[1], corners[2]], [corners[2], corners[3]],
+                        [corners[0], corners[3]]])
 
                 def determine_edge_nodes_to_mesh_quadrilateral_shape_in_both_axis():
                     """
@@ -1051,98 +1038,38 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                     # Determine edge nodes on each edge closest to the centre of that edge
                     # Edge node 1 calc
                     if len(edge_nodes_along_edge1) > 0:
-                        temp_dict_to_measure_distance = {}
-                        for edge_node in edge_nodes_along_edge1:
-                            temp_dict_to_measure_distance[f'{edge_node.id}'] = edge_node.coordinates
-                        centre = [(corners['corner_1'][0] + corners['corner_2'][0]) / 2,
-                                  (corners['corner_1'][1] + corners['corner_2'][1]) / 2,
-                                  (corners['corner_1'][2] + corners['corner_2'][2]) / 2]
-                        closest, index = fem_closest_point(centre,
-                                                           list(temp_dict_to_measure_distance.values()))
-                        id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                            list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                        for edge_node in edge_nodes_along_edge1:
-                            if edge_node.id == int(id_of_centre_node):
-                                edge_node_1 = edge_node
-                                break
+                        centre = _fem_midpoint_coordinates(
+                            corners[0].coordinates, corners[1].coordinates)
+                        edge_node_1 = _fem_get_closest_node(edge_nodes_along_edge1, centre)
                     # Edge node 2 calc
                     if len(edge_nodes_along_edge2) > 0:
-                        temp_dict_to_measure_distance = {}
-                        for edge_node in edge_nodes_along_edge2:
-                            temp_dict_to_measure_distance[f'{edge_node.id}'] = edge_node.coordinates
-                        centre = [(corners['corner_2'][0] + corners['corner_3'][0]) / 2,
-                                  (corners['corner_2'][1] + corners['corner_3'][1]) / 2,
-                                  (corners['corner_2'][2] + corners['corner_3'][2]) / 2]
-                        closest, index = fem_closest_point(centre,
-                                                           list(temp_dict_to_measure_distance.values()))
-                        id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                            list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                        for edge_node in edge_nodes_along_edge2:
-                            if edge_node.id == int(id_of_centre_node):
-                                edge_node_2 = edge_node
-                                break
+                        centre = _fem_midpoint_coordinates(
+                            corners[1].coordinates, corners[2].coordinates)
+                        edge_node_2 = _fem_get_closest_node(edge_nodes_along_edge2, centre)
                     # Edge node 3 calc
                     if len(edge_nodes_along_edge3) > 0:
-                        temp_dict_to_measure_distance = {}
-                        for edge_node in edge_nodes_along_edge3:
-                            temp_dict_to_measure_distance[f'{edge_node.id}'] = edge_node.coordinates
-                        centre = [(corners['corner_3'][0] + corners['corner_4'][0]) / 2,
-                                  (corners['corner_3'][1] + corners['corner_4'][1]) / 2,
-                                  (corners['corner_3'][2] + corners['corner_4'][2]) / 2]
-                        closest, index = fem_closest_point(centre,
-                                                           list(temp_dict_to_measure_distance.values()))
-                        id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                            list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                        for edge_node in edge_nodes_along_edge3:
-                            if edge_node.id == int(id_of_centre_node):
-                                edge_node_3 = edge_node
-                                break
+                        centre = _fem_midpoint_coordinates(
+                            corners[2].coordinates, corners[3].coordinates)
+                        edge_node_3 = _fem_get_closest_node(edge_nodes_along_edge3, centre)
                     # Edge node 4 calc
                     if len(edge_nodes_along_edge4) > 0:
-                        temp_dict_to_measure_distance = {}
-                        for edge_node in edge_nodes_along_edge4:
-                            temp_dict_to_measure_distance[f'{edge_node.id}'] = edge_node.coordinates
-                        centre = [(corners['corner_4'][0] + corners['corner_1'][0]) / 2,
-                                  (corners['corner_4'][1] + corners['corner_1'][1]) / 2,
-                                  (corners['corner_4'][2] + corners['corner_1'][2]) / 2]
-                        closest, index = fem_closest_point(centre,
-                                                           list(temp_dict_to_measure_distance.values()))
-                        id_of_centre_node = list(temp_dict_to_measure_distance.keys())[
-                            list(temp_dict_to_measure_distance.values()).index(list(closest))]
-                        for edge_node in edge_nodes_along_edge4:
-                            if edge_node.id == int(id_of_centre_node):
-                                edge_node_4 = edge_node
-                                break
+                        centre = _fem_midpoint_coordinates(
+                            corners[3].coordinates, corners[0].coordinates)
+                        edge_node_4 = _fem_get_closest_node(edge_nodes_along_edge4, centre)
                     # If no node is present between each corner, generate a node exactly halfway along for each
                     # side
                     if edge_node_1 is None:
-                        edge_node_1 = project.create_node(coordinates=[(corners['corner_1'].coordinates[0] +
-                                                                        corners['corner_2'].coordinates[0]) / 2,
-                                                                       (corners['corner_1'].coordinates[1] +
-                                                                        corners['corner_2'].coordinates[1]) / 2,
-                                                                       (corners['corner_1'].coordinates[2] +
-                                                                        corners['corner_2'].coordinates[2]) / 2])
+                        edge_node_1 = project.create_node(coordinates=_fem_midpoint_coordinates(
+                            corners[0].coordinates, corners[1].coordinates))
                     if edge_node_2 is None:
-                        edge_node_2 = project.create_node(coordinates=[(corners['corner_2'].coordinates[0] +
-                                                                        corners['corner_3'].coordinates[0]) / 2,
-                                                                       (corners['corner_2'].coordinates[1] +
-                                                                        corners['corner_3'].coordinates[1]) / 2,
-                                                                       (corners['corner_2'].coordinates[2] +
-                                                                        corners['corner_3'].coordinates[2]) / 2])
+                        edge_node_2 = project.create_node(coordinates=_fem_midpoint_coordinates(
+                            corners[1].coordinates, corners[2].coordinates))
                     if edge_node_3 is None:
-                        edge_node_3 = project.create_node(coordinates=[(corners['corner_3'].coordinates[0] +
-                                                                        corners['corner_4'].coordinates[0]) / 2,
-                                                                       (corners['corner_3'].coordinates[1] +
-                                                                        corners['corner_4'].coordinates[1]) / 2,
-                                                                       (corners['corner_3'].coordinates[2] +
-                                                                        corners['corner_4'].coordinates[2]) / 2])
+                        edge_node_3 = project.create_node(coordinates=_fem_midpoint_coordinates(
+                            corners[2].coordinates, corners[3].coordinates))
                     if edge_node_4 is None:
-                        edge_node_4 = project.create_node(coordinates=[(corners['corner_4'].coordinates[0] +
-                                                                        corners['corner_1'].coordinates[0]) / 2,
-                                                                       (corners['corner_4'].coordinates[1] +
-                                                                        corners['corner_1'].coordinates[1]) / 2,
-                                                                       (corners['corner_4'].coordinates[2] +
-                                                                        corners['corner_1'].coordinates[2]) / 2])
+                        edge_node_4 = project.create_node(coordinates=_fem_midpoint_coordinates(
+                            corners[3].coordinates, corners[0].coordinates))
                     # nodes along the edge which are now new are to be created as a list
                     return [edge_node_1, edge_node_2, edge_node_3, edge_node_4]
 
@@ -1159,31 +1086,31 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                     # If edge node present along edge 1, split shape from edge 1 to edge 3
                     if len(edge_nodes_along_edge1) > 0 or len(edge_nodes_along_edge3) > 0:
                         # Create a list of nodes along each edge and order it
-                        edge_to_mesh_1.append(corners['corner_1'])
+                        edge_to_mesh_1.append(corners[0])
                         edge_to_mesh_1.extend(edge_nodes_along_edge1)
-                        edge_to_mesh_1.append(corners['corner_2'])
-                        edge_to_mesh_2.append(corners['corner_3'])
+                        edge_to_mesh_1.append(corners[1])
+                        edge_to_mesh_2.append(corners[2])
                         edge_to_mesh_2.extend(edge_nodes_along_edge3)
-                        edge_to_mesh_2.append(corners['corner_4'])
+                        edge_to_mesh_2.append(corners[3])
                         edge_to_mesh_2.reverse()
-                        corner_1_of_edge_1 = corners['corner_1'].coordinates
-                        corner_2_of_edge_1 = corners['corner_2'].coordinates
-                        corner_1_of_edge_2 = corners['corner_4'].coordinates
-                        corner_2_of_edge_2 = corners['corner_3'].coordinates
+                        corner_1_of_edge_1 = corners[0].coordinates
+                        corner_2_of_edge_1 = corners[1].coordinates
+                        corner_1_of_edge_2 = corners[3].coordinates
+                        corner_2_of_edge_2 = corners[2].coordinates
                     # If edge node present along edge 2, split shape from edge 2 to edge 4
                     else:
                         # Create a list of nodes along each edge and order it
-                        edge_to_mesh_1.append(corners['corner_2'])
+                        edge_to_mesh_1.append(corners[1])
                         edge_to_mesh_1.extend(edge_nodes_along_edge2)
-                        edge_to_mesh_1.append(corners['corner_3'])
-                        edge_to_mesh_2.append(corners['corner_4'])
+                        edge_to_mesh_1.append(corners[2])
+                        edge_to_mesh_2.append(corners[3])
                         edge_to_mesh_2.extend(edge_nodes_along_edge4)
-                        edge_to_mesh_2.append(corners['corner_1'])
+                        edge_to_mesh_2.append(corners[0])
                         edge_to_mesh_2.reverse()
-                        corner_1_of_edge_1 = corners['corner_2'].coordinates
-                        corner_2_of_edge_1 = corners['corner_3'].coordinates
-                        corner_1_of_edge_2 = corners['corner_1'].coordinates
-                        corner_2_of_edge_2 = corners['corner_4'].coordinates
+                        corner_1_of_edge_1 = corners[1].coordinates
+                        corner_2_of_edge_1 = corners[2].coordinates
+                        corner_1_of_edge_2 = corners[0].coordinates
+                        corner_2_of_edge_2 = corners[3].coordinates
                     # If the two sides in question have the same number of nodes then fine and move on
                     if len(edge_to_mesh_2) != len(edge_to_mesh_1):
                         # If either side has only 2 and the other has more than 2, add additional nodes to the
@@ -1222,30 +1149,14 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                         return edge_nodes, edge_to_mesh_1, edge_to_mesh_2
 
                 # Create contours for the new areas created from the original panel
-                temp_contour_dict = {}
+                temp_contours = []
                 # If you want to consider the shape being split up into 4 about the centre node
                 if ignore_centre_node is False:
                     edge_nodes = determine_edge_nodes_to_mesh_quadrilateral_shape_in_both_axis()
-                    edge_node_1 = edge_nodes[0]
-                    edge_node_2 = edge_nodes[1]
-                    edge_node_3 = edge_nodes[2]
-                    edge_node_4 = edge_nodes[3]
-                    temp_contour_dict[f'c1'] = project.create_polyline([corners['corner_1'].coordinates,
-                                                                        edge_node_1.coordinates,
-                                                                        centre_node.coordinates,
-                                                                        edge_node_4.coordinates])
-                    temp_contour_dict[f'c2'] = project.create_polyline([edge_node_1.coordinates,
-                                                                        corners['corner_2'].coordinates,
-                                                                        edge_node_2.coordinates,
-                                                                        centre_node.coordinates])
-                    temp_contour_dict[f'c3'] = project.create_polyline([centre_node.coordinates,
-                                                                        edge_node_2.coordinates,
-                                                                        corners['corner_3'].coordinates,
-                                                                        edge_node_3.coordinates])
-                    temp_contour_dict[f'c4'] = project.create_polyline([edge_node_4.coordinates,
-                                                                        centre_node.coordinates,
-                                                                        edge_node_3.coordinates,
-                                                                        corners['corner_4'].coordinates])
+                    temp_contours.extend(
+                        project.create_polyline(points) for points in _fem_quadrilateral_contour_points(
+                            [corner.coordinates for corner in corners[:4]],
+                            [edge_node.coordinates for edge_node in edge_nodes], centre_node.coordinates))
                 # Else, if you are to split the shape in one direction, either vertically or horizontally
                 else:
                     print(determine_edge_nodes_to_mesh_quadrilateral_shape_in_one_direction())
@@ -1253,24 +1164,14 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                         determine_edge_nodes_to_mesh_quadrilateral_shape_in_one_direction()
                     # if ignoring the centre node and doing either splitting the shape horizontally or vertically,
                     # create X no. of new shapes
-                    meshing_counter = 0
                     for node_no in range(len(edge_to_mesh_1) - 1):
-                        temp_contour_dict[f'{meshing_counter}'] = \
+                        temp_contours.append(
                             project.create_polyline([edge_to_mesh_1[node_no].coordinates,
                                                      edge_to_mesh_1[node_no + 1].coordinates,
                                                      edge_to_mesh_2[node_no + 1].coordinates,
-                                                     edge_to_mesh_2[node_no].coordinates])
-                        meshing_counter += 1
+                                                     edge_to_mesh_2[node_no].coordinates]))
                 # generate 4 new panels for the project
-                temp_surface_dict = {}
-                l = 0
-                for key in temp_contour_dict:
-                    value = temp_contour_dict[key]
-                    temp_surface_dict[f'plate{l}'] = project.create_surface(shape_polyline=value,
-                                                                            material=material,
-                                                                            geometry=geometry)
-                    temp_surface_dict[f'plate{l}'].mesh_shape(1, 1)
-                    l += 1
+                temp_surfaces = create_meshed_surfaces(temp_contours)
 
                 # To maintain the direction of members, determine if any members along the edges of the plate
                 # must be split before creating new plates
@@ -1296,146 +1197,125 @@ def mesh_surface_shape(project: 'Project', shape: 'Shape', shapes_to_remove: Lis
                             # check for new found connectivity and to ensure mesh is suitable
                             shapes_to_check_connections.extend(element.get_connecting_shapes())
                             if element.internal_lines is not None:
-                                for internal_line in element.internal_lines:
-                                    for shape_object in project.collections.shapes:
-                                        if hasattr(shape_object.contour,
-                                                   'node_start') and shape_object.contour == internal_line:
-                                            shapes_to_check_connections.append(shape_object)
-                                        elif hasattr(shape_object.contour,
-                                                     'lines') and internal_line in shape_object.contour.lines:
-                                            shapes_to_check_connections.append(shape_object)
+                                shapes_to_check_connections.extend(
+                                    _fem_get_shapes_on_lines(project, element.internal_lines))
                             for value in temp_beam_dict:
                                 shapes_to_check_connections.append(temp_beam_dict[value])
 
-                return temp_surface_dict
+                return temp_surfaces
 
             if no_of_corners == 3:
-                temp_surface_dict = mesh_triangle_shape_with_edges_nodes()
+                temp_surfaces = mesh_triangle_shape_with_edges_nodes()
             # Else, when there are edge nodes present and the shape is a quadrilateral
             else:
-                temp_surface_dict = mesh_quadrilateral_shape_with_nodes_along_edge()
-            return temp_surface_dict
+                temp_surfaces = mesh_quadrilateral_shape_with_nodes_along_edge()
+            return temp_surfaces
 
-        temp_surface_dict = mesh_shape_with_edge_nodes(edge_nodes_to_mesh, internal_nodes_to_mesh)
+        temp_surfaces = mesh_shape_with_edge_nodes(edge_nodes_to_mesh, internal_nodes_to_mesh)
     # Get all shapes that need are to be checked for new connections
     shapes_to_check_connections.extend(shape.get_connecting_shapes())
     # repeat as above, obtain all elements that are in the effected area of the model to
     # check for new found connectivity and to ensure mesh is suitable
     if shape.internal_lines is not None:
-        for internal_line in shape.internal_lines:
-            for shape_object in project.collections.shapes:
-                if hasattr(shape_object.contour, 'node_start') and \
-                        shape_object.contour == internal_line:
-                    shapes_to_check_connections.append(shape_object)
-                elif hasattr(shape_object.contour, 'lines') and \
-                        internal_line in shape_object.contour.lines:
-                    shapes_to_check_connections.append(shape_object)
-    for value in temp_surface_dict:
-        shapes_to_check_connections.extend(temp_surface_dict[value].get_connecting_shapes())
-        shapes_to_check_connections.append(temp_surface_dict[value])
+        shapes_to_check_connections.extend(_fem_get_shapes_on_lines(project, shape.internal_lines))
+    for temp_surface in temp_surfaces:
+        shapes_to_check_connections.extend(temp_surface.get_connecting_shapes())
+        shapes_to_check_connections.append(temp_surface)
     # Account for loads in plates
     # determine if any point loads are associated with the original plate and replace connecting shape
     # with new plate that has been created that shares the node
-    for load in project.collections.point_loads:
-        if load.connecting_shapes[0]['connecting_shape'] == shape:
-            for key in temp_surface_dict:
-                for line in temp_surface_dict[key].contour.lines:
-                    if line.node_start == load.connecting_shapes[0]['shape_geometry'] or \
-                            line.node_end == load.connecting_shapes[0]['shape_geometry']:
-                        load.connecting_shapes[0]['connecting_shape'] = temp_surface_dict[key]
+    for load in _fem_get_connected_items(project.collections.point_loads, shape):
+        for temp_surface in temp_surfaces:
+            for line in temp_surface.contour.lines:
+                if load.connecting_shapes[0]['shape_geometry'] in (line.node_start, line.node_end):
+                    load.connecting_shapes[0]['connecting_shape'] = temp_surface
     # determine if any line loads are associated with the original plate
     line_load_counter = 0
     temp_line_load_dict = {}
-    for load in project.collections.line_loads:
-        if load.connecting_shapes[0]['connecting_shape'] == shape:
-            for key in temp_surface_dict:
-                for line in temp_surface_dict[key].contour.lines:
-                    if line.node_start == load.connecting_shapes[0]['shape_geometry'].node_end or \
-                            line.node_start == load.connecting_shapes[0]['shape_geometry'].node_start or \
-                            line.node_end == load.connecting_shapes[0]['shape_geometry'].node_end or \
-                            line.node_end == load.connecting_shapes[0]['shape_geometry'].node_start:
-                        # Get load attributes
-                        line_load_direction = load.direction
-                        line_load_value = load.value
-                        line_load_type = load.load_type
-                        line_load_case = load.loadcase
-                        loads_to_delete.append(load)
-                        temp_line_load_dict[f'line_load_{line_load_counter}'] = project.create_lineload(
-                            load_type=line_load_type,
-                            value=line_load_value,
-                            direction=line_load_direction,
-                            loadcase=line_load_case,
-                            connecting_shapes=[{"connecting_shape": temp_surface_dict[key],
-                                                "shape_geometry": line}])
-                        line_load_counter += 1
+    for load in _fem_get_connected_items(project.collections.line_loads, shape):
+        for temp_surface in temp_surfaces:
+            for line in temp_surface.contour.lines:
+                if line.node_start == load.connecting_shapes[0]['shape_geometry'].node_end or \
+                        line.node_start == load.connecting_shapes[0]['shape_geometry'].node_start or \
+                        line.node_end == load.connecting_shapes[0]['shape_geometry'].node_end or \
+                        line.node_end == load.connecting_shapes[0]['shape_geometry'].node_start:
+                    # Get load attributes
+                    line_load_direction = load.direction
+                    line_load_value = load.value
+                    line_load_type = load.load_type
+                    line_load_case = load.loadcase
+                    loads_to_delete.append(load)
+                    temp_line_load_dict[f'line_load_{line_load_counter}'] = project.create_lineload(
+                        load_type=line_load_type,
+                        value=line_load_value,
+                        direction=line_load_direction,
+                        loadcase=line_load_case,
+                        connecting_shapes=[{"connecting_shape": temp_surface,
+                                            "shape_geometry": line}])
+                    line_load_counter += 1
     # determine if any plate loads are associated with the original plate and create new plate loads on
     # each new plate generated
     temp_surface_load_dict = {}
     sl = 0
-    for load in project.collections.surface_loads:
-        if load.connecting_shapes[0]['connecting_shape'] == shape:
-            loads_to_delete.append(load)
-            for key in temp_surface_dict:
-                temp_surface_load_dict[f'surface_load_{sl}'] = project.create_surfaceload(
-                    load_type=load.load_type,
-                    value=load.value,
-                    direction=load.direction,
-                    connecting_shapes=[{"connecting_shape": temp_surface_dict[key]}],
-                    loadcase=load.loadcase)
-                sl += 1
+    for load in _fem_get_connected_items(project.collections.surface_loads, shape):
+        loads_to_delete.append(load)
+        for temp_surface in temp_surfaces:
+            temp_surface_load_dict[f'surface_load_{sl}'] = project.create_surfaceload(
+                load_type=load.load_type,
+                value=load.value,
+                direction=load.direction,
+                connecting_shapes=[{"connecting_shape": temp_surface}],
+                loadcase=load.loadcase)
+            sl += 1
     # Account for supports where plates are the connected items
     # point supports
-    for support in project.collections.point_supports:
-        if support.connecting_shapes[0]['connecting_shape'] == shape:
-            for key in temp_surface_dict:
-                for line in temp_surface_dict[key].contour.lines:
-                    if line.node_start == support.connecting_shapes[0]['shape_geometry'] or \
-                            line.node_end == support.connecting_shapes[0]['shape_geometry']:
-                        support.connecting_shapes[0]['connecting_shape'] = temp_surface_dict[key]
+    for support in _fem_get_connected_items(project.collections.point_supports, shape):
+        for temp_surface in temp_surfaces:
+            for line in temp_surface.contour.lines:
+                if support.connecting_shapes[0]['shape_geometry'] in (line.node_start, line.node_end):
+                    support.connecting_shapes[0]['connecting_shape'] = temp_surface
     # line supports
     line_support_dict = {}
     line_support_counter = 0
     # if shape geometry is a line of the original plate and the connecting shape is the original plate
-    for support in project.collections.line_supports:
-        if support.connecting_shapes[0]['connecting_shape'] == shape:
-            for key in temp_surface_dict:
-                for line in temp_surface_dict[key].contour.lines:
-                    if line.node_start == support.connecting_shapes[0]['shape_geometry'].node_end or \
-                            line.node_start == support.connecting_shapes[0]['shape_geometry'].node_start or \
-                            line.node_end == support.connecting_shapes[0]['shape_geometry'].node_end or \
-                            line.node_end == support.connecting_shapes[0]['shape_geometry'].node_start:
-                        degrees_of_freedom = support.degrees_of_freedom
-                        axes = support.axes
-                        spring_stiffnesses = support.spring_stiffnesses
-                        support_set = support.support_set
-                        line_support_dict[
-                            f'line_support{line_support_counter}'] = project.create_linesupport(
-                            connecting_shapes=[{'connecting_shape': temp_surface_dict[key],
-                                                'shape_geometry': line}],
-                            degrees_of_freedom=degrees_of_freedom,
-                            support_set=support_set,
-                            axes=axes,
-                            spring_stiffnesses=spring_stiffnesses)
-                        line_support_counter += 1
+    for support in _fem_get_connected_items(project.collections.line_supports, shape):
+        for temp_surface in temp_surfaces:
+            for line in temp_surface.contour.lines:
+                if line.node_start == support.connecting_shapes[0]['shape_geometry'].node_end or \
+                        line.node_start == support.connecting_shapes[0]['shape_geometry'].node_start or \
+                        line.node_end == support.connecting_shapes[0]['shape_geometry'].node_end or \
+                        line.node_end == support.connecting_shapes[0]['shape_geometry'].node_start:
+                    degrees_of_freedom = support.degrees_of_freedom
+                    axes = support.axes
+                    spring_stiffnesses = support.spring_stiffnesses
+                    support_set = support.support_set
+                    line_support_dict[
+                        f'line_support{line_support_counter}'] = project.create_linesupport(
+                        connecting_shapes=[{'connecting_shape': temp_surface,
+                                            'shape_geometry': line}],
+                        degrees_of_freedom=degrees_of_freedom,
+                        support_set=support_set,
+                        axes=axes,
+                        spring_stiffnesses=spring_stiffnesses)
+                    line_support_counter += 1
     # Surface support check/creation
     surface_support_dict = {}
     surface_support_counter = 0
-    for support in project.collections.surface_supports:
-        if support.connecting_shapes[0]['connecting_shape'] == shape:
-            degrees_of_freedom = support.degrees_of_freedom
-            axes = support.axes
-            spring_stiffnesses = support.spring_stiffnesses
-            support_set = support.support_set
-            for key in temp_surface_dict:
-                surface_support_dict[
-                    f'surface_support{surface_support_counter}'] = project.create_surfacesupport(
-                    connecting_shapes=[{'connecting_shape': temp_surface_dict[key],
-                                        'shape_geometry': temp_surface_dict[key].contour}],
-                    degrees_of_freedom=degrees_of_freedom,
-                    support_set=support_set,
-                    axes=axes,
-                    spring_stiffnesses=spring_stiffnesses)
-                surface_support_counter += 1
+    for support in _fem_get_connected_items(project.collections.surface_supports, shape):
+        degrees_of_freedom = support.degrees_of_freedom
+        axes = support.axes
+        spring_stiffnesses = support.spring_stiffnesses
+        support_set = support.support_set
+        for temp_surface in temp_surfaces:
+            surface_support_dict[
+                f'surface_support{surface_support_counter}'] = project.create_surfacesupport(
+                connecting_shapes=[{'connecting_shape': temp_surface,
+                                    'shape_geometry': temp_surface.contour}],
+                degrees_of_freedom=degrees_of_freedom,
+                support_set=support_set,
+                axes=axes,
+                spring_stiffnesses=spring_stiffnesses)
+            surface_support_counter += 1
     return shapes_to_remove, loads_to_delete, shapes_to_check_connections, mesh_suitable
 
 
@@ -1508,14 +1388,7 @@ def fem_mesh_suitability_checker(project: 'Project', triangle_mesh_allowed=False
                     # they can be checked for new connections formed
                     shapes_to_check_connections.extend(i.get_connecting_shapes())
                     if i.internal_lines is not None:
-                        for internal_line in i.internal_lines:
-                            for shape_object in project.collections.shapes:
-                                if hasattr(shape_object.contour,
-                                           'node_start') and shape_object.contour == internal_line:
-                                    shapes_to_check_connections.append(shape_object)
-                                elif hasattr(shape_object.contour,
-                                             'lines') and internal_line in shape_object.contour.lines:
-                                    shapes_to_check_connections.append(shape_object)
+                        shapes_to_check_connections.extend(_fem_get_shapes_on_lines(project, i.internal_lines))
                     for value in temp_beam_dict:
                         shapes_to_check_connections.append(temp_beam_dict[value])
                     break
@@ -1581,6 +1454,45 @@ def shape_mesh_suitability_corrector(project, triangle_mesh_allowed=False, allow
             - Updates the project with all surface shapes which are compliant with the rules outlined by the input
             parameters
         """
+    def determine_aspect_ratio_of_shape(shape):
+        """
+        Determines the aspect ratio of the shape and returns the maximum aspect ratio and the shape in
+        question
+        """
+        # Gather the contour nodes
+        contour_nodes = []
+        for j in range(len(shape.contour.lines)):
+            if j != len(shape.contour.lines) - 1:
+                if shape.contour.lines[j].node_start == shape.contour.lines[j + 1].node_start or \
+                        shape.contour.lines[j].node_start == shape.contour.lines[j + 1].node_end:
+                    contour_nodes.append(shape.contour.lines[j].node_end)
+                else:
+                    contour_nodes.append(shape.contour.lines[j].node_start)
+            else:
+                if shape.contour.lines[j].node_start == shape.contour.lines[0].node_start or \
+                        shape.contour.lines[j].node_start == shape.contour.lines[0].node_end:
+                    contour_nodes.append(shape.contour.lines[j].node_end)
+                else:
+                    contour_nodes.append(shape.contour.lines[j].node_start)
+        # Identify the corners
+        corner1 = contour_nodes[0].coordinates
+        corner2 = contour_nodes[1].coordinates
+        corner3 = contour_nodes[2].coordinates
+        corner4 = contour_nodes[3].coordinates
+        side_ab = fem_distance_coordinates(corner1, corner2)
+        side_bc = fem_distance_coordinates(corner2, corner3)
+        side_cd = fem_distance_coordinates(corner3, corner4)
+        side_da = fem_distance_coordinates(corner4, corner1)
+        # Determine if any side has an aspect ratio larger than the allowable aspect ratio
+        if max(side_ab / side_bc, side_ab / side_da, side_cd / side_bc,
+               side_cd / side_da) > allowable_aspect_ratio:
+            # if true, determine what the ratio is
+            aspect_ratio = max(side_ab / side_bc, side_ab / side_da, side_cd / side_bc, side_cd / side_da)
+        else:
+            # If true, determine what the aspect ratio is
+            aspect_ratio = max(side_bc / side_ab, side_bc / side_cd, side_da / side_ab, side_da / side_cd)
+        return aspect_ratio
+
     # Check the mesh suitability
     project.connect_all_shapes()
     fem_mesh_suitability_checker(project, triangle_mesh_allowed=triangle_mesh_allowed)
@@ -1598,50 +1510,10 @@ def shape_mesh_suitability_corrector(project, triangle_mesh_allowed=False, allow
                 continue
             elif len(shape.contour.lines) != 4:
                 continue
-            else:
-                def determine_aspect_ratio_of_shape(shape):
-                    """
-                    Determines the aspect ratio of the shape and returns the maximum aspect ratio and the shape in
-                    question
-                    """
-                    # Gather the contour nodes
-                    contour_nodes = []
-                    for j in range(len(shape.contour.lines)):
-                        if j != len(shape.contour.lines) - 1:
-                            if shape.contour.lines[j].node_start == shape.contour.lines[j + 1].node_start or \
-                                    shape.contour.lines[j].node_start == shape.contour.lines[j + 1].node_end:
-                                contour_nodes.append(shape.contour.lines[j].node_end)
-                            else:
-                                contour_nodes.append(shape.contour.lines[j].node_start)
-                        else:
-                            if shape.contour.lines[j].node_start == shape.contour.lines[0].node_start or \
-                                    shape.contour.lines[j].node_start == shape.contour.lines[0].node_end:
-                                contour_nodes.append(shape.contour.lines[j].node_end)
-                            else:
-                                contour_nodes.append(shape.contour.lines[j].node_start)
-                    # Identify the corners
-                    corner1 = contour_nodes[0].coordinates
-                    corner2 = contour_nodes[1].coordinates
-                    corner3 = contour_nodes[2].coordinates
-                    corner4 = contour_nodes[3].coordinates
-                    side_ab = fem_distance_coordinates(corner1, corner2)
-                    side_bc = fem_distance_coordinates(corner2, corner3)
-                    side_cd = fem_distance_coordinates(corner3, corner4)
-                    side_da = fem_distance_coordinates(corner4, corner1)
-                    # Determine if any side has an aspect ratio larger than the allowable aspect ratio
-                    if max(side_ab / side_bc, side_ab / side_da, side_cd / side_bc,
-                           side_cd / side_da) > allowable_aspect_ratio:
-                        # if true, determine what the ratio is
-                        aspect_ratio = max(side_ab / side_bc, side_ab / side_da, side_cd / side_bc, side_cd / side_da)
-                    else:
-                        # If true, determine what the aspect ratio is
-                        aspect_ratio = max(side_bc / side_ab, side_bc / side_cd, side_da / side_ab, side_da / side_cd)
-                    return aspect_ratio
-
-                aspect_ratio = determine_aspect_ratio_of_shape(shape)
-                if aspect_ratio > max_aspect_ratio:
-                    max_aspect_ratio = aspect_ratio
-                    max_aspect_ratio_shape = shape
+            aspect_ratio = determine_aspect_ratio_of_shape(shape)
+            if aspect_ratio > max_aspect_ratio:
+                max_aspect_ratio = aspect_ratio
+                max_aspect_ratio_shape = shape
 
         def split_shape_with_aspect_ratio_which_is_too_large():
             """